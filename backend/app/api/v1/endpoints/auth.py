@@ -6,15 +6,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from typing import Optional
-import hashlib
+from datetime import datetime, timezone
+import asyncio
+import secrets
 
 from app.database.database import get_db
 from app.database.models import User
 from app.core.config import settings
+from app.core.auth import extract_bearer_token, hash_password, verify_password, password_needs_rehash, invalidate_user, ensure_admin_user
 from app.core.jwt import create_user_token, blacklist_token, clear_user_tokens, get_current_user_from_token
 
 router = APIRouter()
 
+# Default admin credentials, encoded once for constant-time comparison
+_DEFAULT_ADMIN_USERNAME = settings.BASIC_AUTH_USERNAME.encode()
+_DEFAULT_ADMIN_PASSWORD = settings.BASIC_AUTH_PASSWORD.encode()
+
 class LoginRequest(BaseModel):
     username: str
     password: str
@@ -32,6 +39,13 @@ class MessageResponse(BaseModel):
     message: str
 
 
+def _is_default_admin(credentials: LoginRequest) -> bool:
+    """Check login credentials against the configured default admin"""
+    username_ok = secrets.compare_digest(credentials.username.encode(), _DEFAULT_ADMIN_USERNAME)
+    password_ok = secrets.compare_digest(credentials.password.encode(), _DEFAULT_ADMIN_PASSWORD)
+    return username_ok & password_ok
+
+
 @router.post("/login", response_model=LoginResponse)
 async def login(
     credentials: LoginRequest,
@@ -42,21 +56,27 @@ async def login(
     """
     # Get user from database first
     result = await db.execute(
-        select(User).where(User.username == credentials.username)
+        select(User).where(User.username == credentials.username).limit(1)
     )
     user = result.scalar_one_or_none()
     
     # If user exists, verify against database password
     if user:
-        password_hash = hashlib.sha256(credentials.password.encode()).hexdigest()
-        if user.password_hash == password_hash and user.is_active:
-            # Update last login
-            from datetime import datetime, timezone
+        password_valid = await asyncio.to_thread(
+            verify_password, user.password_hash, credentials.password
+        )
+        if password_valid and user.is_active:
+            # Upgrade legacy or outdated hashes on successful login
+            if password_needs_rehash(user.password_hash):
+                user.password_hash = await asyncio.to_thread(hash_password, credentials.password)
+
+            # Update last login (committed together with any rehash)
             user.last_login = datetime.now()
             await db.commit()
+            invalidate_user(user.id)
             
             # Create JWT token
-            access_token = create_user_token(
+            access_token = await create_user_token(
                 user_id=user.id,
                 username=user.username,
                 is_admin=user.is_admin
@@ -75,29 +95,17 @@ async def login(
                 }
             )
     
-    # If no user exists and credentials match default admin, create user
-    elif (credentials.username == settings.BASIC_AUTH_USERNAME and 
-          credentials.password == settings.BASIC_AUTH_PASSWORD):
+    # If no user exists and credentials match default admin, create user.
+    # Compare both fields in constant time and without short-circuiting so
+    # response timing doesn't reveal which part matched.
+    elif _is_default_admin(credentials):
         
-        # Create admin user with default password
-        password_hash = hashlib.sha256(credentials.password.encode()).hexdigest()
-        user = User(
-            username=credentials.username,
-            password_hash=password_hash,
-            is_admin=True,
-            is_active=True
-        )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        
-        # Update last login
-        from datetime import datetime, timezone
-        user.last_login = datetime.now(timezone.utc)
-        await db.commit()
+        # The admin row is created at startup; this only recovers if it has gone missing
+        user = await ensure_admin_user(db, last_login=datetime.now(timezone.utc))
+        invalidate_user(user.id)
         
         # Create JWT token
-        access_token = create_user_token(
+        access_token = await create_user_token(
             user_id=user.id,
             username=user.username,
             is_admin=user.is_admin
@@ -129,14 +137,8 @@ async def logout(
     """
     Logout by blacklisting current JWT token
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Bearer token required"
-        )
-    
-    token = authorization.split(" ")[1]
-    success = blacklist_token(token)
+    token = extract_bearer_token(authorization)
+    success = await blacklist_token(token)
     
     if success:
         return MessageResponse(message="Successfully logged out")
@@ -153,14 +155,8 @@ async def change_password(
     """
     Change user password (requires current password verification)
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Bearer token required"
-        )
-    
-    token = authorization.split(" ")[1]
-    user_info = get_current_user_from_token(token)
+    token = extract_bearer_token(authorization)
+    user_info = await get_current_user_from_token(token)
     
     if not user_info:
         raise HTTPException(
@@ -170,7 +166,7 @@ async def change_password(
     
     # Get user from database
     result = await db.execute(
-        select(User).where(User.id == user_info["user_id"])
+        select(User).where(User.id == user_info["user_id"]).limit(1)
     )
     user = result.scalar_one_or_none()
     
@@ -181,20 +177,22 @@ async def change_password(
         )
     
     # Verify current password
-    current_password_hash = hashlib.sha256(request.current_password.encode()).hexdigest()
-    if user.password_hash != current_password_hash:
+    password_valid = await asyncio.to_thread(
+        verify_password, user.password_hash, request.current_password
+    )
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password
-    new_password_hash = hashlib.sha256(request.new_password.encode()).hexdigest()
-    user.password_hash = new_password_hash
+    user.password_hash = await asyncio.to_thread(hash_password, request.new_password)
     await db.commit()
+    invalidate_user(user.id)
     
     # Clear all tokens for this user (force re-login)
-    cleared_count = clear_user_tokens(user.id)
+    cleared_count = await clear_user_tokens(user.id)
     
     return MessageResponse(
         message=f"Password changed successfully. {cleared_count} active sessions terminated."
@@ -208,14 +206,8 @@ async def verify_token(
     """
     Verify JWT token and return user info
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Bearer token required"
-        )
-    
-    token = authorization.split(" ")[1]
-    user_info = get_current_user_from_token(token)
+    token = extract_bearer_token(authorization)
+    user_info = await get_current_user_from_token(token)
     
     if not user_info:
         raise HTTPException(
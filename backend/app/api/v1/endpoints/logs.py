@@ -2,24 +2,49 @@
 Enhanced Log Management API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, BinaryIO, Tuple
 import os
-import json
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 import asyncio
+import itertools
+import functools
+from collections import Counter
 import aiofiles
+import orjson
+
+try:
+    from watchfiles import awatch, Change
+except ImportError:
+    awatch = None
 
 from app.database.database import get_db
 from app.database.models import User
 from app.core.auth import get_current_user
-from app.core.logging import logging_config
+from app.core.logging import logging_config, LOG_READ_BLOCK_SIZE, count_lines, read_tail_lines
 from pydantic import BaseModel, validator
 
 router = APIRouter()
 
+# Concurrent file scans in search/analytics
+MAX_CONCURRENT_LOG_SCANS = 8
+
+# Error entries collected by analytics
+MAX_ERROR_PATTERNS = 50
+
+# First standalone log level word in a free-form line
+_LEVEL_RE = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+# Characters that make a search query a regex rather than a plain literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Timestamp prefix written by file handlers ('%Y-%m-%d %H:%M:%S')
+LOG_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_TIMESTAMP_LENGTH = 19
+
 
 class LogSearchRequest(BaseModel):
     """Request model for log search"""
@@ -70,32 +95,13 @@ async def get_log_files_enhanced(
     try:
         log_files = logging_config.get_log_files()
 
-        # Add additional metadata
-        enhanced_files = {}
-        for filename, info in log_files.items():
-            if info.get('exists', False):
-                file_path = Path(info['path'])
-
-                # Count lines and estimate records
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        line_count = sum(1 for _ in f)
-
-                    enhanced_files[filename] = {
-                        **info,
-                        "line_count": line_count,
-                        "category": filename.split('.')[0],
-                        "is_json": filename.endswith('.json'),
-                        "can_search": True
-                    }
-                except Exception as e:
-                    enhanced_files[filename] = {
-                        **info,
-                        "error": f"Could not read file: {str(e)}",
-                        "can_search": False
-                    }
-            else:
-                enhanced_files[filename] = info
+        # Add additional metadata, collecting files concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOG_SCANS)
+        metadata = await asyncio.gather(*(
+            _log_file_metadata(filename, info, semaphore)
+            for filename, info in log_files.items()
+        ))
+        enhanced_files = dict(zip(log_files.keys(), metadata))
 
         return {
             "log_files": enhanced_files,
@@ -121,44 +127,36 @@ async def get_log_file_content_paginated(
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    log_file_path = logging_config.logs_dir / filename
-
-    if not log_file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Log file '{filename}' not found"
-        )
-
     # Security check
-    if not str(log_file_path).startswith(str(logging_config.logs_dir)):
+    log_file_path = logging_config.resolve_log_file(filename)
+    if log_file_path is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
 
-    try:
-        async with aiofiles.open(log_file_path, 'r', encoding='utf-8') as f:
-            content = await f.read()
-            lines = content.splitlines()
-
-        total_lines = len(lines)
+    if not await asyncio.to_thread(log_file_path.is_file):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Log file '{filename}' not found"
+        )
 
-        # Reverse if needed (newest first)
-        if reverse:
-            lines = lines[::-1]
+    try:
+        stat = await asyncio.to_thread(log_file_path.stat)
+        total_lines = await asyncio.to_thread(count_lines, str(log_file_path), stat.st_mtime_ns, stat.st_size)
 
         # Calculate pagination
         start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        page_lines = lines[start_idx:end_idx]
 
-        # If reversed, we need to reverse back the page for proper order
+        # Read only the requested page (from EOF when newest entries come first)
         if reverse:
-            page_lines = page_lines[::-1]
+            page_lines = await asyncio.to_thread(read_tail_lines, log_file_path, start_idx, per_page)
+        else:
+            page_lines = await asyncio.to_thread(_read_head_lines, log_file_path, start_idx, per_page)
 
         total_pages = (total_lines + per_page - 1) // per_page
 
-        return {
+        payload = {
             "filename": filename,
             "total_lines": total_lines,
             "total_pages": total_pages,
@@ -166,9 +164,12 @@ async def get_log_file_content_paginated(
             "per_page": per_page,
             "has_next": page < total_pages,
             "has_prev": page > 1,
-            "content": page_lines,
             "reversed": reverse
         }
+        return StreamingResponse(
+            _stream_json_with_content(payload, page_lines),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -199,64 +200,34 @@ async def search_logs(
                     search_files.append(file_path)
         else:
             # Search all log files
-            search_files = list(logging_config.logs_dir.glob("*.log"))
-            search_files.extend(list(logging_config.logs_dir.glob("*.json")))
-
-        for log_file in search_files:
-            try:
-                async with aiofiles.open(log_file, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    lines = content.splitlines()
-
-                for line_num, line in enumerate(lines, 1):
-                    # Skip empty lines
-                    if not line.strip():
-                        continue
-
-                    # Apply filters
-                    if search_pattern and not search_pattern.search(line):
-                        continue
-
-                    # Parse log entry for additional filtering
-                    log_entry = _parse_log_line(line, log_file.name)
-
-                    # Filter by log level
-                    if request.level and log_entry.get('level') != request.level.upper():
-                        continue
-
-                    # Filter by time range
-                    if request.start_time or request.end_time:
-                        entry_time = log_entry.get('timestamp')
-                        if entry_time:
-                            try:
-                                if isinstance(entry_time, str):
-                                    entry_time = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
-
-                                if request.start_time and entry_time < request.start_time:
-                                    continue
-                                if request.end_time and entry_time > request.end_time:
-                                    continue
-                            except Exception:
-                                # If timestamp parsing fails, include the entry
-                                pass
-
-                    results.append({
-                        "file": log_file.name,
-                        "line_number": line_num,
-                        "content": line,
-                        "parsed": log_entry
-                    })
-
-                    # Limit results
-                    if len(results) >= request.limit:
-                        break
-
-                if len(results) >= request.limit:
-                    break
-
-            except Exception as e:
-                # Log file read error, continue with other files
-                continue
+            search_files = _list_log_files(logging_config.logs_dir)
+
+        # Hoist per-line lookups out of the scan loop
+        search = search_pattern.search if search_pattern else None
+        search_bytes = None
+        if (request.query and request.query.isascii()
+                and _REGEX_METACHARACTERS.isdisjoint(request.query)):
+            # Plain ASCII literals can be grepped on raw bytes before decoding.
+            # Real regexes can't: classes like \w, . or \b match differently on bytes.
+            search_bytes = re.compile(re.escape(request.query).encode(), re.IGNORECASE).search
+        level_filter = request.level.upper() if request.level else None
+        start_time = request.start_time
+        end_time = request.end_time
+
+        # Scan files concurrently, bounding open file descriptors
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOG_SCANS)
+        per_file_results = await asyncio.gather(*(
+            _search_log_file(
+                log_file, semaphore, search, search_bytes,
+                level_filter, start_time, end_time, request.limit
+            )
+            for log_file in search_files
+        ))
+
+        # Keep file order and apply the global limit
+        for file_results in per_file_results:
+            results.extend(file_results)
+        del results[request.limit:]
 
         return {
             "results": results,
@@ -289,70 +260,39 @@ async def get_log_analytics(
                 "end": datetime.now().isoformat(),
                 "hours": hours
             },
-            "by_level": {},
-            "by_category": {},
-            "by_hour": {},
+            "by_level": Counter(),
+            "by_category": Counter(),
+            "by_hour": Counter(),
             "error_patterns": [],
             "total_entries": 0
         }
 
         # Process all log files
-        log_files = list(logging_config.logs_dir.glob("*.log"))
-        log_files.extend(list(logging_config.logs_dir.glob("*.json")))
-
-        for log_file in log_files:
-            try:
-                async with aiofiles.open(log_file, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    lines = content.splitlines()
-
-                category = log_file.stem
-
-                for line in lines:
-                    if not line.strip():
-                        continue
-
-                    log_entry = _parse_log_line(line, log_file.name)
-                    entry_time = log_entry.get('timestamp')
-
-                    # Filter by time
-                    if entry_time:
-                        try:
-                            if isinstance(entry_time, str):
-                                entry_time = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
-
-                            if entry_time < cutoff_time:
-                                continue
-                        except Exception:
-                            continue
-
-                    analytics["total_entries"] += 1
-
-                    # Count by level
-                    level = log_entry.get('level', 'UNKNOWN')
-                    analytics["by_level"][level] = analytics["by_level"].get(level, 0) + 1
-
-                    # Count by category
-                    analytics["by_category"][category] = analytics["by_category"].get(category, 0) + 1
+        log_files = _list_log_files(logging_config.logs_dir)
+
+        # Scan files concurrently, bounding open file descriptors
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOG_SCANS)
+        per_file_stats = await asyncio.gather(*(
+            _analyze_log_file(log_file, semaphore, cutoff_time)
+            for log_file in log_files
+        ))
+
+        for log_file, (levels, hours_counts, error_patterns) in zip(log_files, per_file_stats):
+            entry_count = sum(levels.values())
+            if not entry_count:
+                continue
 
-                    # Count by hour
-                    if entry_time:
-                        hour_key = entry_time.strftime('%Y-%m-%d %H:00')
-                        analytics["by_hour"][hour_key] = analytics["by_hour"].get(hour_key, 0) + 1
+            # Category is constant per file
+            analytics["total_entries"] += entry_count
+            analytics["by_category"][log_file.stem] += entry_count
+            analytics["by_level"] += levels
+            analytics["by_hour"] += hours_counts
+            analytics["error_patterns"].extend(error_patterns)
 
-                    # Collect error patterns
-                    if level in ['ERROR', 'CRITICAL']:
-                        message = log_entry.get('message', line)
-                        if len(analytics["error_patterns"]) < 50:  # Limit error patterns
-                            analytics["error_patterns"].append({
-                                "timestamp": entry_time.isoformat() if entry_time else None,
-                                "level": level,
-                                "message": message[:200] + "..." if len(message) > 200 else message,
-                                "category": category
-                            })
+        del analytics["error_patterns"][MAX_ERROR_PATTERNS:]
 
-            except Exception:
-                continue
+        for key in ("by_level", "by_category", "by_hour"):
+            analytics[key] = dict(analytics[key])
 
         return analytics
 
@@ -372,83 +312,181 @@ async def log_stream_websocket(
     """Real-time log streaming via WebSocket"""
     await websocket.accept()
 
+    # Open handles kept across iterations, positioned at the last read offset
+    open_handles: Dict[str, BinaryIO] = {}
+
+    def watch_file(file_name: str, from_end: bool) -> Optional[BinaryIO]:
+        """Open a log file for tailing, optionally skipping existing content"""
+        try:
+            handle = open(logging_config.logs_dir / file_name, 'rb', buffering=0)
+        except OSError:
+            return None
+        if from_end:
+            handle.seek(0, os.SEEK_END)
+        open_handles[file_name] = handle
+        return handle
+
+    def unwatch_file(file_name: str) -> None:
+        """Close and forget a tailed log file"""
+        handle = open_handles.pop(file_name, None)
+        if handle is not None:
+            handle.close()
+
+    # Set once the client goes away; sends alone can't detect this when filters
+    # drop every line
+    disconnected = asyncio.Event()
+
+    async def wait_for_disconnect() -> None:
+        """Drain client messages until the socket closes"""
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+        except Exception:
+            pass
+        finally:
+            disconnected.set()
+
+    async def pause(seconds: float) -> None:
+        """Sleep between polls, returning early on disconnect"""
+        try:
+            await asyncio.wait_for(disconnected.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    disconnect_task = asyncio.create_task(wait_for_disconnect())
+
     try:
         # Parse filter parameters
         category_filter = [c.strip() for c in categories.split(',') if c.strip()] if categories else []
         level_filter = [l.strip().upper() for l in levels.split(',') if l.strip()] if levels else []
 
-        # Monitor log files for changes
-        monitored_files = {}
+        # Build filter sets once per connection (None means accept all)
+        category_set = frozenset(category_filter) if category_filter else None
+        level_set = frozenset(level_filter) if level_filter else None
+
+        # Raw substring prefilter for levels; unparseable lines default to INFO,
+        # so it only applies when INFO is not requested
+        prefilter_levels = tuple(level_set) if level_set and 'INFO' not in level_set else None
+
+        # Start tailing existing files from their current end
+        for log_file in _list_log_files(logging_config.logs_dir, ('.log',)):
+            watch_file(log_file.name, from_end=True)
 
-        # Get initial file positions
-        log_files = list(logging_config.logs_dir.glob("*.log"))
-        for log_file in log_files:
-            if log_file.exists():
-                monitored_files[str(log_file)] = log_file.stat().st_size
+        async def send_new_lines(file_name: str) -> None:
+            """Read content appended since the last offset and send matching lines"""
+            log_file = logging_config.logs_dir / file_name
+
+            # Category is known from the file name, skip filtered files before reading
+            category = log_file.stem
+            if category_set is not None and category not in category_set:
+                return
+
+            handle = open_handles.get(file_name)
+
+            if handle is not None:
+                try:
+                    file_stat = log_file.stat()
+                except FileNotFoundError:
+                    return
+
+                # File was rotated or truncated, restart from the beginning
+                if (file_stat.st_ino != os.fstat(handle.fileno()).st_ino
+                        or file_stat.st_size < handle.tell()):
+                    unwatch_file(file_name)
+                    handle = None
+
+            if handle is None:
+                handle = watch_file(file_name, from_end=False)
+                if handle is None:
+                    return
 
-        while True:
             try:
-                # Check for file changes
-                for file_path, last_size in list(monitored_files.items()):
-                    log_file = Path(file_path)
-                    if not log_file.exists():
-                        continue
+                new_content = handle.read()
+            except OSError:
+                # Error reading file, continue monitoring
+                return
 
-                    current_size = log_file.stat().st_size
-                    if current_size > last_size:
-                        # File has grown, read new content
-                        try:
-                            with open(log_file, 'r', encoding='utf-8') as f:
-                                f.seek(last_size)
-                                new_content = f.read()
-
-                            monitored_files[file_path] = current_size
-
-                            # Process new lines
-                            for line in new_content.splitlines():
-                                if not line.strip():
-                                    continue
-
-                                log_entry = _parse_log_line(line, log_file.name)
-
-                                # Apply filters
-                                category = log_file.stem
-                                if category_filter and category not in category_filter:
-                                    continue
-
-                                level = log_entry.get('level', '')
-                                if level_filter and level not in level_filter:
-                                    continue
-
-                                # Send to client
-                                await websocket.send_json({
-                                    "timestamp": datetime.now().isoformat(),
-                                    "file": log_file.name,
-                                    "category": category,
-                                    "content": line,
-                                    "parsed": log_entry
-                                })
-
-                        except Exception as e:
-                            # Error reading file, continue monitoring
-                            continue
+            if not new_content:
+                return
+
+            # Decode the whole batch once, then process new lines
+            for line in new_content.decode('utf-8', errors='replace').splitlines():
+                if not line.strip():
+                    continue
+
+                # Drop lines that cannot match the level filter before parsing
+                if prefilter_levels and not any(lvl in line for lvl in prefilter_levels):
+                    continue
 
-                # Check for new files
-                current_files = list(logging_config.logs_dir.glob("*.log"))
-                for log_file in current_files:
-                    file_path = str(log_file)
-                    if file_path not in monitored_files and log_file.exists():
-                        monitored_files[file_path] = log_file.stat().st_size
+                log_entry = _parse_log_line(line, log_file.name)
 
-                # Wait before next check
-                await asyncio.sleep(1)
+                # Confirm level on the parsed entry
+                level = log_entry.get('level', '')
+                if level_set is not None and level not in level_set:
+                    continue
 
-            except Exception as e:
+                # Send to client
                 await websocket.send_json({
-                    "error": f"Monitoring error: {str(e)}",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now().isoformat(),
+                    "file": log_file.name,
+                    "category": category,
+                    "content": line,
+                    "parsed": log_entry
                 })
-                await asyncio.sleep(5)
+
+        def is_tailed_file(change, path: str) -> bool:
+            """Only wake up for log files in the requested categories"""
+            file_name = os.path.basename(path)
+            if not file_name.endswith('.log'):
+                return False
+            return category_set is None or file_name[:-len('.log')] in category_set
+
+        if awatch is not None:
+            # Wait for filesystem notifications instead of polling
+            async for changes in awatch(
+                logging_config.logs_dir, watch_filter=is_tailed_file, stop_event=disconnected
+            ):
+                try:
+                    for change, path in changes:
+                        file_name = os.path.basename(path)
+
+                        if change == Change.deleted:
+                            unwatch_file(file_name)
+                        else:
+                            await send_new_lines(file_name)
+
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    await websocket.send_json({
+                        "error": f"Monitoring error: {str(e)}",
+                        "timestamp": datetime.now().isoformat()
+                    })
+        else:
+            while not disconnected.is_set():
+                try:
+                    # Check for file changes
+                    for file_name in list(open_handles):
+                        await send_new_lines(file_name)
+
+                    # Check for new files
+                    for log_file in _list_log_files(logging_config.logs_dir, ('.log',)):
+                        if log_file.name not in open_handles:
+                            watch_file(log_file.name, from_end=True)
+
+                    # Wait before next check
+                    await pause(1)
+
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    await websocket.send_json({
+                        "error": f"Monitoring error: {str(e)}",
+                        "timestamp": datetime.now().isoformat()
+                    })
+                    await pause(5)
 
     except WebSocketDisconnect:
         pass
@@ -460,14 +498,305 @@ async def log_stream_websocket(
             })
         except:
             pass
+    finally:
+        disconnect_task.cancel()
+        for file_name in list(open_handles):
+            unwatch_file(file_name)
+
+
+def _list_log_files(logs_dir: Path, suffixes: Tuple[str, ...] = ('.log', '.json')) -> List[Path]:
+    """List log files with the given suffixes in a single directory scan (.log files first)"""
+    with os.scandir(logs_dir) as entries:
+        log_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False)
+        ]
+    log_files.sort(key=lambda log_file: log_file.suffix != '.log')
+    return log_files
+
+
+def _stream_json_with_content(payload: Dict[str, Any], lines: List[str]):
+    """Yield `payload` as a JSON object whose `content` array is encoded line by line"""
+    yield orjson.dumps(payload)[:-1] + b',"content":['
+    for index, line in enumerate(lines):
+        yield (b',' if index else b'') + orjson.dumps(line)
+    yield b']}'
+
+
+def _read_head_lines(path: Path, skip: int, count: int) -> List[str]:
+    """Read `count` lines after skipping the first `skip` lines"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return [line.rstrip('\n') for line in itertools.islice(f, skip, skip + count)]
+
+
+async def _log_file_metadata(
+    filename: str,
+    info: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """Add line count and search metadata to a log file entry"""
+    if not info.get('exists', False):
+        return info
+
+    file_path = Path(info['path'])
+
+    # Count lines and estimate records
+    try:
+        async with semaphore:
+            stat = await asyncio.to_thread(file_path.stat)
+            line_count = await asyncio.to_thread(
+                count_lines, str(file_path), stat.st_mtime_ns, stat.st_size
+            )
+
+        return {
+            **info,
+            "line_count": line_count,
+            "category": filename.split('.')[0],
+            "is_json": filename.endswith('.json'),
+            "can_search": True
+        }
+    except Exception as e:
+        return {
+            **info,
+            "error": f"Could not read file: {str(e)}",
+            "can_search": False
+        }
+
+
+async def _search_log_file(
+    log_file: Path,
+    semaphore: asyncio.Semaphore,
+    search,
+    search_bytes,
+    level_filter: Optional[str],
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """Search a single log file, returning at most `limit` matches"""
+    results = []
+    try:
+        async with semaphore:
+            start_offset, first_line_num = 0, 1
+            if start_time and log_file.suffix == '.log':
+                # Skip lines older than start_time by bisecting on timestamps
+                start_offset, first_line_num = await asyncio.to_thread(
+                    _locate_log_time_offset, log_file, start_time
+                )
+
+            if log_file.suffix == '.log' and (search_bytes or start_offset):
+                async with aiofiles.open(log_file, 'rb') as f:
+                    await f.seek(start_offset)
+                    raw = await f.read()
+                raw_lines = enumerate(raw.splitlines(), first_line_num)
+
+                # Grep raw bytes first and decode only matching lines. Non-ASCII lines
+                # always go to the str matcher, whose case folding is Unicode-aware.
+                lines = (
+                    (line_num, raw_line.decode('utf-8', errors='replace'))
+                    for line_num, raw_line in raw_lines
+                    if not search_bytes or search_bytes(raw_line) or not raw_line.isascii()
+                )
+            else:
+                async with aiofiles.open(log_file, 'r', encoding='utf-8') as f:
+                    content = await f.read()
+                lines = enumerate(content.splitlines(), 1)
+
+        for line_num, line in lines:
+            # Skip empty lines
+            if not line.strip():
+                continue
+
+            # Apply filters
+            if search and not search(line):
+                continue
+
+            # Parse log entry for additional filtering
+            log_entry = _parse_log_line(line, log_file.name)
+
+            # Filter by log level
+            if level_filter and log_entry.get('level') != level_filter:
+                continue
+
+            # Filter by time range
+            if start_time or end_time:
+                entry_time = log_entry.get('timestamp')
+                if entry_time:
+                    try:
+                        if isinstance(entry_time, str):
+                            entry_time = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
+
+                        if start_time and entry_time < start_time:
+                            continue
+                        if end_time and entry_time > end_time:
+                            continue
+                    except Exception:
+                        # If timestamp parsing fails, include the entry
+                        pass
+
+            results.append({
+                "file": log_file.name,
+                "line_number": line_num,
+                "content": line,
+                "parsed": log_entry
+            })
+
+            # Limit results
+            if len(results) >= limit:
+                break
+
+    except Exception:
+        # Log file read error, continue with other files
+        pass
+
+    return results
+
+
+async def _analyze_log_file(
+    log_file: Path,
+    semaphore: asyncio.Semaphore,
+    cutoff_time: datetime
+) -> Tuple[Counter, Counter, List[Dict[str, Any]]]:
+    """Count entries newer than cutoff_time in a single log file by level and hour"""
+    levels: Counter = Counter()
+    hours_counts: Counter = Counter()
+    error_patterns: List[Dict[str, Any]] = []
+
+    try:
+        async with semaphore:
+            async with aiofiles.open(log_file, 'r', encoding='utf-8') as f:
+                content = await f.read()
+                lines = content.splitlines()
+
+        category = log_file.stem
+
+        # Batches are merged into the counters once per file
+        levels_batch = []
+        hours_batch = []
+
+        for line in lines:
+            if not line.strip():
+                continue
+
+            log_entry = _parse_log_line(line, log_file.name)
+            entry_time = log_entry.get('timestamp')
+
+            # Filter by time
+            if entry_time:
+                try:
+                    if isinstance(entry_time, str):
+                        entry_time = datetime.fromisoformat(entry_time.replace('Z', '+00:00'))
+
+                    if entry_time < cutoff_time:
+                        continue
+                except Exception:
+                    continue
+
+            # Count by level
+            level = log_entry.get('level', 'UNKNOWN')
+            levels_batch.append(level)
+
+            # Count by hour
+            if entry_time:
+                hours_batch.append(entry_time.strftime('%Y-%m-%d %H:00'))
+
+            # Collect error patterns
+            if level in ['ERROR', 'CRITICAL']:
+                message = log_entry.get('message', line)
+                if len(error_patterns) < MAX_ERROR_PATTERNS:  # Limit error patterns
+                    error_patterns.append({
+                        "timestamp": entry_time.isoformat() if entry_time else None,
+                        "level": level,
+                        "message": message[:200] + "..." if len(message) > 200 else message,
+                        "category": category
+                    })
+
+        levels.update(levels_batch)
+        hours_counts.update(hours_batch)
+
+    except Exception:
+        # Unreadable file contributes nothing
+        return Counter(), Counter(), []
+
+    return levels, hours_counts, error_patterns
+
+
+def _peek_timestamp(raw_line: bytes) -> Optional[datetime]:
+    """Parse the timestamp prefix of a raw log line, if present"""
+    if len(raw_line) < LOG_TIMESTAMP_LENGTH:
+        return None
+    try:
+        return datetime.strptime(raw_line[:LOG_TIMESTAMP_LENGTH].decode('ascii'), LOG_TIMESTAMP_FORMAT)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _locate_log_time_offset(path: Path, start_time: datetime) -> Tuple[int, int]:
+    """
+    Find the byte offset (and its 1-based line number) of the first line that
+    may be at or after start_time. Bisects on line timestamps, relying on .log
+    files being append-only; lines without a timestamp belong to the entry above.
+    """
+    if start_time.tzinfo is not None:
+        # File handlers write timestamps in local time
+        start_time = start_time.astimezone().replace(tzinfo=None)
+
+    with open(path, 'rb') as f:
+        lo, hi = 0, f.seek(0, os.SEEK_END)
+
+        while hi - lo > LOG_READ_BLOCK_SIZE:
+            mid = (lo + hi) // 2
+            f.seek(mid)
+            f.readline()  # Skip partial line
+
+            timestamp = None
+            while timestamp is None and f.tell() < hi:
+                line = f.readline()
+                if not line:
+                    break
+                timestamp = _peek_timestamp(line)
+
+            if timestamp is None or timestamp >= start_time:
+                hi = mid
+            else:
+                lo = mid
+
+        offset = 0
+        if lo > 0:
+            f.seek(lo)
+            f.readline()
+            offset = f.tell()
+
+        # Keep line numbers absolute by counting newlines in the skipped prefix
+        f.seek(0)
+        skipped_lines = 0
+        remaining = offset
+        while remaining > 0:
+            block = f.read(min(LOG_READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            skipped_lines += block.count(b"\n")
+            remaining -= len(block)
+
+    return offset, skipped_lines + 1
+
+
+def _extract_level(line: str) -> str:
+    """Find the first log level word in a free-form line"""
+    match = _LEVEL_RE.search(line)
+    return match.group(1) if match else 'INFO'
 
 
+@functools.lru_cache(maxsize=32768)
 def _parse_log_line(line: str, filename: str) -> Dict[str, Any]:
-    """Parse a log line to extract structured information"""
+    """
+    Parse a log line to extract structured information.
+    Results are cached and shared between callers, so they must not be mutated.
+    """
     try:
         # Try JSON parsing first
         if filename.endswith('.json'):
-            return json.loads(line)
+            return orjson.loads(line)
 
         # Parse standard log format: timestamp - name - level - message
         parts = line.split(' - ', 3)
@@ -486,8 +815,7 @@ def _parse_log_line(line: str, filename: str) -> Dict[str, Any]:
                 pass
 
         # Fallback: try to extract level from line
-        level_match = re.search(r'\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b', line)
-        level = level_match.group(1) if level_match else 'INFO'
+        level = _extract_level(line)
 
         return {
             "timestamp": None,
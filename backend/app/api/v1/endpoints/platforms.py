@@ -2,14 +2,22 @@
 Registry-based Platforms API endpoints
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+import functools
+import shlex
+import orjson
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Dict, Any
+from sqlalchemy.engine import RowMapping
+from typing import List, Optional, Dict, Any, AsyncGenerator, Tuple
 
 from app.database.database import get_db
 from app.database.models import PlatformUserConfig, User
 from app.core.auth import get_current_user
-from app.services.platform_service import PlatformService
+from app.core.http_cache import make_etag, cached_json_response
+from app.services.platform_service import PlatformService, PlatformNotSupportedError
+from app.services.platforms.registry import PlatformRegistry
 from app.schemas.platform import (
     PlatformDefinitionResponse, PlatformDefinitionListResponse,
     PlatformUserConfigCreate, PlatformUserConfigUpdate, PlatformUserConfigResponse,
@@ -22,187 +30,181 @@ from app.schemas.platform import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Reused serializer for the platform list (returning a Response skips response_model re-validation)
+_PLATFORM_LIST_ADAPTER = TypeAdapter(PlatformListResponse)
+_STREAM_INFO_ADAPTER = TypeAdapter(StreamInfoResponse)
+
+_STREAMLINK_PREFIX = "streamlink "
+
+
+async def get_platform_service(
+    db: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[PlatformService, None]:
+    """
+    Dependency providing a request-scoped PlatformService, closed after the response
+    """
+    platform_service = PlatformService(db)
+    try:
+        yield platform_service
+    finally:
+        await platform_service.close()
+
+
+@functools.lru_cache(maxsize=64)
+def _platform_schema_bytes(registry_version: int, platform_name: str) -> Optional[Tuple[bytes, str]]:
+    """Serialized schema response and its ETag for a platform at a registry version"""
+    definition = PlatformRegistry.get_platform(platform_name)
+    if not definition:
+        return None
+    content = orjson.dumps({
+        "platform_name": platform_name,
+        "schema": definition.config_schema
+    })
+    return content, make_etag(content)
+
+
+@functools.lru_cache(maxsize=1)
+def _definition_responses(registry_version: int) -> Tuple[PlatformDefinitionResponse, ...]:
+    """Definition responses for all registered platforms, rebuilt only when the registry changes"""
+    return tuple(
+        PlatformDefinitionResponse.model_validate(definition)
+        for definition in PlatformRegistry.get_all_platforms()
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _definition_response(registry_version: int, platform_name: str) -> Optional[PlatformDefinitionResponse]:
+    """Definition response for a single platform at a registry version"""
+    definition = PlatformRegistry.get_platform(platform_name)
+    if not definition:
+        return None
+    return PlatformDefinitionResponse.model_validate(definition)
+
+
+@functools.lru_cache(maxsize=1)
+def _definition_list_bytes(registry_version: int) -> Tuple[bytes, str]:
+    """Serialized available-platforms response and its ETag for a registry version"""
+    definitions = _definition_responses(registry_version)
+    content = orjson.dumps({
+        "platforms": [definition.model_dump() for definition in definitions],
+        "total": len(definitions)
+    })
+    return content, make_etag(content)
+
+
+def _platform_info_response(
+    definition: PlatformDefinitionResponse,
+    user_config: Optional[RowMapping]
+) -> PlatformInfoResponse:
+    """Combine a cached definition response with an optional user config row"""
+    if user_config is None:
+        return PlatformInfoResponse(definition=definition, is_configured=False)
+    return PlatformInfoResponse(
+        definition=definition,
+        user_config=PlatformUserConfigResponse(**user_config),
+        is_configured=True
+    )
+
 
 @router.get("/", response_model=PlatformListResponse)
 async def get_platforms(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Get comprehensive list of all platforms with their definitions and user configurations
     """
-    platform_service = PlatformService(db)
+    # Get all user configurations (the only awaited call on this path)
+    user_configs_db = await platform_service.get_all_platform_configs()
+    user_configs_map = {config["platform_name"]: config for config in user_configs_db}
     
-    try:
-        # Get all platform definitions from registry
-        definitions = platform_service.get_available_platforms()
-        
-        # Get all user configurations
-        user_configs_db = await platform_service.get_all_platform_configs()
-        user_configs_map = {config.platform_name: config for config in user_configs_db}
-        
-        platforms = []
-        for definition in definitions:
-            user_config = user_configs_map.get(definition.name)
-            
-            platforms.append(PlatformInfoResponse(
-                definition=PlatformDefinitionResponse(
-                    name=definition.name,
-                    display_name=definition.display_name,
-                    description=definition.description,
-                    requires_auth=definition.requires_auth,
-                    supports_chat=definition.supports_chat,
-                    supports_vod=definition.supports_vod,
-                    help_text=definition.help_text,
-                    setup_instructions=definition.setup_instructions,
-                    config_schema=definition.config_schema,
-                    supported_qualities=definition.supported_qualities,
-                    default_streamlink_args=definition.default_streamlink_args,
-                    default_output_format=definition.default_output_format,
-                    supported_output_formats=definition.supported_output_formats,
-                    default_filename_template=definition.default_filename_template
-                ),
-                user_config=PlatformUserConfigResponse(
-                    platform_name=user_config.platform_name,
-                    user_credentials=user_config.user_credentials,
-                    custom_settings=user_config.custom_settings,
-                    created_at=user_config.created_at,
-                    updated_at=user_config.updated_at
-                ) if user_config else None,
-                is_configured=user_config is not None
-            ))
-        
-        return PlatformListResponse(
-            platforms=platforms,
-            total=len(platforms)
-        )
-        
-    finally:
-        await platform_service.close()
+    # Get all platform definitions from registry (cached per registry version)
+    definitions = _definition_responses(PlatformRegistry.get_version())
+    
+    platforms = [
+        _platform_info_response(definition, user_configs_map.get(definition.name))
+        for definition in definitions
+    ]
+    
+    payload = PlatformListResponse(
+        platforms=platforms,
+        total=len(platforms)
+    )
+    return Response(content=_PLATFORM_LIST_ADAPTER.dump_json(payload), media_type="application/json")
 
 
 @router.get("/available", response_model=PlatformDefinitionListResponse)
 async def get_available_platforms(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get list of all available platform definitions from registry
     """
-    platform_service = PlatformService(db)
+    content, etag = _definition_list_bytes(PlatformRegistry.get_version())
+    return cached_json_response(request, content, etag)
+
+
+@router.get("/supported", response_model=SupportedPlatformsResponse)
+async def get_supported_platforms(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get list of supported platforms from registry
+    """
+    supported_platforms = [definition.name for definition in PlatformRegistry.get_all_platforms()]
     
-    try:
-        definitions = platform_service.get_available_platforms()
-        
-        platforms = [
-            PlatformDefinitionResponse(
-                name=definition.name,
-                display_name=definition.display_name,
-                description=definition.description,
-                requires_auth=definition.requires_auth,
-                supports_chat=definition.supports_chat,
-                supports_vod=definition.supports_vod,
-                help_text=definition.help_text,
-                setup_instructions=definition.setup_instructions,
-                config_schema=definition.config_schema,
-                supported_qualities=definition.supported_qualities,
-                default_streamlink_args=definition.default_streamlink_args,
-                default_output_format=definition.default_output_format,
-                supported_output_formats=definition.supported_output_formats,
-                default_filename_template=definition.default_filename_template
-            )
-            for definition in definitions
-        ]
-        
-        return PlatformDefinitionListResponse(
-            platforms=platforms,
-            total=len(platforms)
-        )
-        
-    finally:
-        await platform_service.close()
+    return SupportedPlatformsResponse(
+        supported_platforms=supported_platforms,
+        total=len(supported_platforms)
+    )
 
 
 @router.get("/{platform_name}/schema", response_model=PlatformSchemaResponse)
 async def get_platform_schema(
+    request: Request,
     platform_name: str = Path(..., description="Platform name"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get configuration schema for a specific platform
     """
-    platform_service = PlatformService(db)
-    
-    try:
-        schema = platform_service.get_platform_schema(platform_name)
-        if not schema:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform {platform_name} not found"
-            )
-        
-        return PlatformSchemaResponse(
-            platform_name=platform_name,
-            schema=schema
+    cached = _platform_schema_bytes(PlatformRegistry.get_version(), platform_name)
+    if cached is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Platform {platform_name} not found"
         )
-        
-    finally:
-        await platform_service.close()
+    
+    content, etag = cached
+    return cached_json_response(request, content, etag)
 
 
 @router.get("/{platform_name}", response_model=PlatformInfoResponse)
 async def get_platform(
     platform_name: str = Path(..., description="Platform name"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Get specific platform information with definition and user configuration
     """
-    platform_service = PlatformService(db)
-    
-    try:
-        # Get platform definition
-        definition = platform_service.get_platform_definition(platform_name)
-        if not definition:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform {platform_name} not found"
-            )
-        
-        # Get user configuration
-        user_config = await platform_service.get_platform_user_config(platform_name)
-        
-        return PlatformInfoResponse(
-            definition=PlatformDefinitionResponse(
-                name=definition.name,
-                display_name=definition.display_name,
-                description=definition.description,
-                requires_auth=definition.requires_auth,
-                supports_chat=definition.supports_chat,
-                supports_vod=definition.supports_vod,
-                help_text=definition.help_text,
-                setup_instructions=definition.setup_instructions,
-                config_schema=definition.config_schema,
-                supported_qualities=definition.supported_qualities,
-                default_streamlink_args=definition.default_streamlink_args,
-                default_output_format=definition.default_output_format,
-                supported_output_formats=definition.supported_output_formats,
-                default_filename_template=definition.default_filename_template
-            ),
-            user_config=PlatformUserConfigResponse(
-                platform_name=user_config.platform_name,
-                user_credentials=user_config.user_credentials,
-                custom_settings=user_config.custom_settings,
-                created_at=user_config.created_at,
-                updated_at=user_config.updated_at
-            ) if user_config else None,
-            is_configured=user_config is not None
+    # Get platform definition (cached per registry version)
+    definition = _definition_response(PlatformRegistry.get_version(), platform_name)
+    if not definition:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Platform {platform_name} not found"
         )
-        
-    finally:
-        await platform_service.close()
+    
+    # Get user configuration
+    user_config = await platform_service.get_platform_user_config(platform_name)
+    
+    return PlatformInfoResponse(
+        definition=definition,
+        user_config=PlatformUserConfigResponse.model_validate(user_config) if user_config else None,
+        is_configured=user_config is not None
+    )
 
 
 @router.post("/{platform_name}/config", response_model=PlatformUserConfigResponse)
@@ -210,13 +212,11 @@ async def create_or_update_platform_config(
     platform_name: str = Path(..., description="Platform name"),
     config_data: PlatformUserConfigCreate = ...,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Create or update platform user configuration
     """
-    platform_service = PlatformService(db)
-    
     try:
         await platform_service.update_platform_config(
             platform=platform_name,
@@ -232,21 +232,13 @@ async def create_or_update_platform_config(
                 detail="Failed to create platform configuration"
             )
         
-        return PlatformUserConfigResponse(
-            platform_name=user_config.platform_name,
-            user_credentials=user_config.user_credentials,
-            custom_settings=user_config.custom_settings,
-            created_at=user_config.created_at,
-            updated_at=user_config.updated_at
-        )
+        return PlatformUserConfigResponse.model_validate(user_config)
         
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    finally:
-        await platform_service.close()
 
 
 @router.put("/{platform_name}/config", response_model=PlatformUserConfigResponse)
@@ -254,74 +246,50 @@ async def update_platform_config(
     platform_name: str = Path(..., description="Platform name"),
     config_data: PlatformUserConfigUpdate = ...,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Update existing platform user configuration
     """
-    platform_service = PlatformService(db)
-    
     try:
-        # Check if configuration exists
-        existing_config = await platform_service.get_platform_user_config(platform_name)
-        if not existing_config:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform configuration for {platform_name} not found"
-            )
-        
-        await platform_service.update_platform_config(
+        # Update and return the row in one round-trip (None if it does not exist)
+        user_config = await platform_service.update_existing_platform_config(
             platform=platform_name,
             user_credentials=config_data.user_credentials,
             custom_settings=config_data.custom_settings
         )
-        
-        # Return updated configuration
-        user_config = await platform_service.get_platform_user_config(platform_name)
-        
-        return PlatformUserConfigResponse(
-            platform_name=user_config.platform_name,
-            user_credentials=user_config.user_credentials,
-            custom_settings=user_config.custom_settings,
-            created_at=user_config.created_at,
-            updated_at=user_config.updated_at
-        )
-        
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    finally:
-        await platform_service.close()
+    
+    if not user_config:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Platform configuration for {platform_name} not found"
+        )
+    
+    return PlatformUserConfigResponse.model_validate(user_config)
 
 
 @router.delete("/{platform_name}/config")
 async def delete_platform_config(
     platform_name: str = Path(..., description="Platform name"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Delete platform user configuration
     """
-    platform_service = PlatformService(db)
+    # Delete and check existence in one round-trip
+    if not await platform_service.delete_platform_config(platform_name):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Platform configuration for {platform_name} not found"
+        )
     
-    try:
-        # Check if configuration exists
-        existing_config = await platform_service.get_platform_user_config(platform_name)
-        if not existing_config:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform configuration for {platform_name} not found"
-            )
-        
-        await platform_service.delete_platform_config(platform_name)
-        
-        return {"message": f"Platform configuration for {platform_name} deleted successfully"}
-        
-    finally:
-        await platform_service.close()
+    return {"message": f"Platform configuration for {platform_name} deleted successfully"}
 
 
 @router.get("/{platform_name}/stream-info", response_model=StreamInfoResponse)
@@ -329,43 +297,38 @@ async def get_stream_info(
     platform_name: str,
     streamer_id: str = Query(..., description="Streamer ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Get stream information for a specific platform and streamer
     """
-    platform_service = PlatformService(db)
-    
+    # Validate platform and get stream info in a single call
     try:
-        # Validate platform
-        if not await platform_service.get_strategy(platform_name):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform '{platform_name}' not supported or not configured"
-            )
-        
-        # Get stream info
-        stream_info = await platform_service.get_stream_info(platform_name, streamer_id)
-        
-        if not stream_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Stream not found or not live for {streamer_id} on {platform_name}"
-            )
-        
-        return StreamInfoResponse(
-            platform=platform_name,
-            streamer_id=stream_info.streamer_id,
-            streamer_name=stream_info.streamer_name,
-            title=stream_info.title,
-            is_live=stream_info.is_live,
-            viewer_count=stream_info.viewer_count,
-            thumbnail_url=stream_info.thumbnail_url,
-            started_at=stream_info.started_at
+        _, stream_info = await platform_service.get_stream_info_checked(platform_name, streamer_id)
+    except PlatformNotSupportedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
     
-    finally:
-        await platform_service.close()
+    if not stream_info:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Stream not found or not live for {streamer_id} on {platform_name}"
+        )
+    
+    payload = StreamInfoResponse(
+        platform=platform_name,
+        streamer_id=stream_info.streamer_id,
+        streamer_name=stream_info.streamer_name,
+        title=stream_info.title,
+        is_live=stream_info.is_live,
+        viewer_count=stream_info.viewer_count,
+        thumbnail_url=stream_info.thumbnail_url,
+        started_at=stream_info.started_at
+    )
+    return Response(content=_STREAM_INFO_ADAPTER.dump_json(payload), media_type="application/json")
+
 
 
 @router.get("/{platform_name}/stream-urls", response_model=StreamUrlsResponse)
@@ -373,40 +336,34 @@ async def get_stream_urls(
     platform_name: str,
     streamer_id: str = Query(..., description="Streamer ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Get available stream URLs for a specific platform and streamer
     """
-    platform_service = PlatformService(db)
-    
+    # Validate platform and get stream URLs in a single call
     try:
-        # Validate platform
-        if not await platform_service.get_strategy(platform_name):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform '{platform_name}' not supported or not configured"
-            )
-        
-        # Get stream URLs
-        stream_urls = await platform_service.get_stream_urls(platform_name, streamer_id)
-        
-        return StreamUrlsResponse(
-            platform=platform_name,
-            streamer_id=streamer_id,
-            stream_urls=[
-                StreamUrlResponse(
-                    url=url.url,
-                    quality=url.quality,
-                    format=url.format,
-                    bandwidth=url.bandwidth
-                )
-                for url in stream_urls
-            ]
+        _, stream_urls = await platform_service.get_stream_urls_checked(platform_name, streamer_id)
+    except PlatformNotSupportedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
     
-    finally:
-        await platform_service.close()
+    return StreamUrlsResponse(
+        platform=platform_name,
+        streamer_id=streamer_id,
+        stream_urls=[
+            StreamUrlResponse(
+                url=url.url,
+                quality=url.quality,
+                format=url.format,
+                bandwidth=url.bandwidth
+            )
+            for url in stream_urls
+        ]
+    )
+
 
 
 @router.get("/{platform_name}/streamlink-args", response_model=StreamlinkArgsResponse)
@@ -415,53 +372,24 @@ async def get_streamlink_args(
     streamer_id: str = Query(..., description="Streamer ID"),
     quality: str = Query("best", description="Stream quality"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    platform_service: PlatformService = Depends(get_platform_service)
 ):
     """
     Get Streamlink command arguments for a specific platform and streamer
     """
-    platform_service = PlatformService(db)
-    
+    # Validate platform and get Streamlink arguments in a single call
     try:
-        # Validate platform
-        if not await platform_service.get_strategy(platform_name):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Platform '{platform_name}' not supported or not configured"
-            )
-        
-        # Get Streamlink arguments
-        args = await platform_service.get_streamlink_args(platform_name, streamer_id, quality)
-        
-        return StreamlinkArgsResponse(
-            platform=platform_name,
-            streamer_id=streamer_id,
-            quality=quality,
-            arguments=args,
-            command=f"streamlink {' '.join(args)}"
+        _, args = await platform_service.get_streamlink_args_checked(platform_name, streamer_id, quality)
+    except PlatformNotSupportedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
     
-    finally:
-        await platform_service.close()
-
-
-@router.get("/supported", response_model=SupportedPlatformsResponse)
-async def get_supported_platforms(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    Get list of supported platforms from registry
-    """
-    platform_service = PlatformService(db)
-    
-    try:
-        configured_platforms = await platform_service.get_configured_platforms()
-        supported_platforms = [definition.name for definition in platform_service.get_available_platforms()]
-        
-        return SupportedPlatformsResponse(
-            supported_platforms=supported_platforms,
-            total=len(supported_platforms)
-        )
-    finally:
-        await platform_service.close()
+    return StreamlinkArgsResponse(
+        platform=platform_name,
+        streamer_id=streamer_id,
+        quality=quality,
+        arguments=args,
+        command=_STREAMLINK_PREFIX + shlex.join(args)
+    )
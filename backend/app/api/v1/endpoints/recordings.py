@@ -1,27 +1,62 @@
 """
 Recordings API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import List, Optional
+from sqlalchemy import select, and_, func, tuple_
+from typing import AsyncIterator, List, Optional
+import asyncio
 import os
+from datetime import datetime
+from pathlib import Path
 
 from app.database.database import get_db
 from app.database.models import Recording, User
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, get_current_admin_user
 from app.core.config import settings
+from app.core.http_cache import make_etag, is_not_modified, apply_cache_headers, cache_headers, not_modified_response
 from app.schemas.recording import RecordingResponse, RecordingCreate, RecordingUpdate
 from app.core.service_container import get_service_container
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _encode_cursor(recording: Recording) -> str:
+    """Build an opaque keyset cursor from a recording's (created_at, id)"""
+    return f"{recording.created_at.isoformat()}_{recording.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Parse a keyset cursor back into (created_at, id)"""
+    try:
+        created_at, recording_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(recording_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+async def _stream_recordings_ndjson(query) -> AsyncIterator[str]:
+    """Yield one JSON document per recording, fetching rows incrementally"""
+    container = get_service_container()
+
+    # The request-scoped UoW is closed once the handler returns, so the stream owns its own
+    async with container.get_uow_factory()() as uow:
+        async for recording in await uow.session.stream_scalars(query):
+            yield RecordingResponse.model_validate(recording).model_dump_json() + "\n"
+
 
 @router.get("", response_model=List[RecordingResponse])
 async def get_recordings(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
+    before: Optional[str] = Query(None, description="Cursor from the previous page's Link header"),
     platform: Optional[str] = None,
     streamer_id: Optional[str] = None,
     is_favorite: Optional[bool] = None,
@@ -29,8 +64,13 @@ async def get_recordings(
 ):
     """
     Get list of recordings with optional filters
+
+    Pages are keyset-paginated on (created_at, id); follow the rel="next" Link header to continue.
+    Send "Accept: application/x-ndjson" to stream one recording per line instead of a JSON array.
     """
     container = get_service_container()
+    wants_ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    cursor = _decode_cursor(before) if before else None
 
     async with container.get_uow_factory()() as uow:
         query = select(Recording)
@@ -47,11 +87,34 @@ async def get_recordings(
         if filters:
             query = query.where(and_(*filters))
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit).order_by(Recording.created_at.desc())
+        # Validate client cache against a single aggregate over the filtered set
+        version_query = select(func.max(Recording.updated_at), func.count(Recording.id))
+        if filters:
+            version_query = version_query.where(and_(*filters))
+        last_modified, total = (await uow.session.execute(version_query)).one()
+        etag = make_etag("recordings", last_modified, total, before, limit, platform, streamer_id, is_favorite, wants_ndjson)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        apply_cache_headers(response, etag, last_modified)
+
+        # Apply ordering and keyset pagination (seeks via the index instead of scanning skipped rows)
+        if cursor:
+            query = query.where(tuple_(Recording.created_at, Recording.id) < cursor)
+        query = query.order_by(Recording.created_at.desc(), Recording.id.desc()).limit(limit)
+
+        if wants_ndjson:
+            return StreamingResponse(
+                _stream_recordings_ndjson(query),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=cache_headers(etag, last_modified)
+            )
+
+        recordings = (await uow.session.scalars(query)).all()
 
-        result = await uow._session.execute(query)
-        recordings = result.scalars().all()
+        # A full page means there may be more rows past the last one
+        if len(recordings) == limit:
+            next_url = request.url.include_query_params(before=_encode_cursor(recordings[-1]))
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
 
         return recordings
 
@@ -59,6 +122,8 @@ async def get_recordings(
 @router.get("/{recording_id}", response_model=RecordingResponse)
 async def get_recording(
     recording_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -75,6 +140,12 @@ async def get_recording(
                 detail="Recording not found"
             )
 
+        last_modified = recording.updated_at or recording.created_at
+        etag = make_etag("recording", recording.id, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        apply_cache_headers(response, etag, last_modified)
+
         return recording
 
 
@@ -89,19 +160,17 @@ async def toggle_favorite(
     container = get_service_container()
 
     async with container.get_uow_factory()() as uow:
-        recording = await uow.recordings.get_by_id(recording_id)
+        is_favorite = await uow.recordings.toggle_favorite(recording_id)
 
-        if not recording:
+        if is_favorite is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
 
-        recording.is_favorite = not recording.is_favorite
-        await uow.recordings.update(recording)
         await uow.commit()
 
-        return {"message": f"Recording {'marked as favorite' if recording.is_favorite else 'unmarked from favorite'}"}
+        return {"message": f"Recording {'marked as favorite' if is_favorite else 'unmarked from favorite'}"}
 
 
 @router.get("/{recording_id}/download")
@@ -124,7 +193,7 @@ async def download_recording(
             )
 
         # Check if file exists
-        if not os.path.exists(recording.file_path):
+        if not await asyncio.to_thread(os.path.exists, recording.file_path):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording file not found on disk"
@@ -141,37 +210,30 @@ async def download_recording(
 @router.delete("/{recording_id}")
 async def delete_recording(
     recording_id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Delete a recording (admin only)
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required"
-        )
-
     container = get_service_container()
 
     async with container.get_uow_factory()() as uow:
-        recording = await uow.recordings.get_by_id(recording_id)
+        file_path = await uow.recordings.get_file_path(recording_id)
 
-        if not recording:
+        if file_path is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
 
-        # Delete file if exists
-        if os.path.exists(recording.file_path):
-            try:
-                os.remove(recording.file_path)
-            except OSError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to delete file: {str(e)}"
-                )
+        # Delete file if exists (single syscall off the event loop; missing file is fine)
+        try:
+            await asyncio.to_thread(Path(file_path).unlink, missing_ok=True)
+        except OSError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to delete file: {str(e)}"
+            )
 
         success = await uow.recordings.delete(recording_id)
         if success:
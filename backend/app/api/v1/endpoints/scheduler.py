@@ -1,14 +1,13 @@
 """
 Scheduler API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional, Dict
-from datetime import datetime
-
-from app.database.database import get_db
-from app.database.models import RecordingSchedule, User
+import asyncio
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from typing import List
+
+from app.database.models import User
 from app.core.auth import get_current_user
 from app.core.service_container import get_service_container
 from app.schemas.schedule import (
@@ -20,6 +19,10 @@ from app.schemas.schedule import (
 
 router = APIRouter()
 
+# Validators built once at import instead of per response
+_schedules_adapter = TypeAdapter(List[RecordingScheduleResponse])
+_schedule_adapter = TypeAdapter(RecordingScheduleResponse)
+
 
 @router.get("/status")
 async def get_scheduler_status(
@@ -31,10 +34,16 @@ async def get_scheduler_status(
     container = get_service_container()
     scheduler_service = container.get_scheduler_service()
 
+    # Independent lookups (each uses its own session), so run them concurrently
+    active_recordings, schedule_status = await asyncio.gather(
+        scheduler_service.get_active_recordings(),
+        scheduler_service.get_all_schedule_status()
+    )
+
     return {
         "scheduler_info": scheduler_service.get_scheduler_info(),
-        "active_recordings": await scheduler_service.get_active_recordings(),
-        "schedule_status": await scheduler_service.get_all_schedule_status()
+        "active_recordings": active_recordings,
+        "schedule_status": schedule_status
     }
 
 
@@ -96,32 +105,9 @@ async def get_schedules(
     container = get_service_container()
 
     async with container.get_uow_factory()() as uow:
-        result = await uow._session.execute(select(RecordingSchedule))
-        schedules = result.scalars().all()
+        schedules = await uow.schedules.list_all()
     
-    return [
-        RecordingScheduleResponse(
-            id=schedule.id,
-            platform=schedule.platform,
-            streamer_id=schedule.streamer_id,
-            streamer_name=schedule.streamer_name,
-            quality=schedule.quality,
-            custom_arguments=schedule.custom_arguments,
-            enabled=schedule.enabled,
-            output_format=schedule.output_format,
-            filename_template=schedule.filename_template,
-            rotation_enabled=schedule.rotation_enabled,
-            rotation_type=schedule.rotation_type,
-            max_age_days=schedule.max_age_days,
-            max_count=schedule.max_count,
-            max_size_gb=schedule.max_size_gb,
-            protect_favorites=schedule.protect_favorites,
-            delete_empty_files=schedule.delete_empty_files,
-            created_at=schedule.created_at,
-            updated_at=schedule.updated_at
-        )
-        for schedule in schedules
-    ]
+    return _schedules_adapter.validate_python(schedules, from_attributes=True)
 
 
 @router.get("/schedules/{schedule_id}", response_model=RecordingScheduleResponse)
@@ -143,26 +129,7 @@ async def get_schedule(
                 detail=f"Schedule {schedule_id} not found"
             )
     
-    return RecordingScheduleResponse(
-        id=schedule.id,
-        platform=schedule.platform,
-        streamer_id=schedule.streamer_id,
-        streamer_name=schedule.streamer_name,
-        quality=schedule.quality,
-        custom_arguments=schedule.custom_arguments,
-        enabled=schedule.enabled,
-        output_format=schedule.output_format,
-        filename_template=schedule.filename_template,
-        rotation_enabled=schedule.rotation_enabled,
-        rotation_type=schedule.rotation_type,
-        max_age_days=schedule.max_age_days,
-        max_count=schedule.max_count,
-        max_size_gb=schedule.max_size_gb,
-        protect_favorites=schedule.protect_favorites,
-        delete_empty_files=schedule.delete_empty_files,
-        created_at=schedule.created_at,
-        updated_at=schedule.updated_at
-    )
+    return _schedule_adapter.validate_python(schedule, from_attributes=True)
 
 
 @router.post("/schedules", response_model=RecordingScheduleResponse)
@@ -176,37 +143,21 @@ async def create_schedule(
     container = get_service_container()
     scheduler_service = container.get_scheduler_service()
 
-    # Create schedule object
-    schedule = RecordingSchedule(**schedule_data.model_dump())
-
-    success = await scheduler_service.add_schedule(schedule)
+    try:
+        schedule = await scheduler_service.add_schedule(schedule_data.model_dump())
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Schedule for {schedule_data.platform}/{schedule_data.streamer_id} already exists"
+        )
 
-    if not success:
+    if schedule is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create schedule"
         )
     
-    return RecordingScheduleResponse(
-        id=schedule.id,
-        platform=schedule.platform,
-        streamer_id=schedule.streamer_id,
-        streamer_name=schedule.streamer_name,
-        quality=schedule.quality,
-        custom_arguments=schedule.custom_arguments,
-        enabled=schedule.enabled,
-        output_format=schedule.output_format,
-        filename_template=schedule.filename_template,
-        rotation_enabled=schedule.rotation_enabled,
-        rotation_type=schedule.rotation_type,
-        max_age_days=schedule.max_age_days,
-        max_count=schedule.max_count,
-        max_size_gb=schedule.max_size_gb,
-        protect_favorites=schedule.protect_favorites,
-        delete_empty_files=schedule.delete_empty_files,
-        created_at=schedule.created_at,
-        updated_at=schedule.updated_at
-    )
+    return _schedule_adapter.validate_python(schedule, from_attributes=True)
 
 
 @router.put("/schedules/{schedule_id}", response_model=RecordingScheduleResponse)
@@ -221,8 +172,16 @@ async def update_schedule(
     container = get_service_container()
 
     async with container.get_uow_factory()() as uow:
-        # Get existing schedule
-        schedule = await uow.schedules.get_by_id(schedule_id)
+        # Update fields and fetch the updated row in one statement
+        values = schedule_update.model_dump(exclude_unset=True)
+        try:
+            schedule = await uow.schedules.update_fields(schedule_id, values)
+        except IntegrityError:
+            await uow.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Schedule for this platform/streamer already exists"
+            )
 
         if not schedule:
             raise HTTPException(
@@ -230,45 +189,13 @@ async def update_schedule(
                 detail=f"Schedule {schedule_id} not found"
             )
 
-        # Update fields
-        for field, value in schedule_update.model_dump(exclude_unset=True).items():
-            setattr(schedule, field, value)
-
-        await uow.schedules.update(schedule)
         await uow.commit()
 
         # Update scheduler service
         scheduler_service = container.get_scheduler_service()
-        await scheduler_service._start_monitoring(schedule)
-
-        success = True
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update schedule"
-            )
+        await scheduler_service.refresh_monitoring(schedule, values)
     
-    return RecordingScheduleResponse(
-        id=schedule.id,
-        platform=schedule.platform,
-        streamer_id=schedule.streamer_id,
-        streamer_name=schedule.streamer_name,
-        quality=schedule.quality,
-        custom_arguments=schedule.custom_arguments,
-        enabled=schedule.enabled,
-        output_format=schedule.output_format,
-        filename_template=schedule.filename_template,
-        rotation_enabled=schedule.rotation_enabled,
-        rotation_type=schedule.rotation_type,
-        max_age_days=schedule.max_age_days,
-        max_count=schedule.max_count,
-        max_size_gb=schedule.max_size_gb,
-        protect_favorites=schedule.protect_favorites,
-        delete_empty_files=schedule.delete_empty_files,
-        created_at=schedule.created_at,
-        updated_at=schedule.updated_at
-    )
+    return _schedule_adapter.validate_python(schedule, from_attributes=True)
 
 
 @router.delete("/schedules/{schedule_id}")
@@ -1,15 +1,21 @@
 """
 Schedules API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy import select, func, not_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, raiseload
+from typing import List, Optional
 
 from app.database.database import get_db
 from app.database.models import RecordingSchedule, User
 from app.core.auth import get_current_user
+from app.core.http_cache import make_etag, is_not_modified, apply_cache_headers, not_modified_response
+from app.core.service_container import get_service_container
+from app.repositories.schedule_repository import ScheduleRepository, SCHEDULE_LIST_COLUMNS
+from app.services.scheduler_service_v2 import SchedulerServiceV2
 from app.schemas.schedule import (
     RecordingScheduleResponse, 
     RecordingScheduleCreate, 
@@ -18,70 +24,82 @@ from app.schemas.schedule import (
 
 router = APIRouter()
 
+# Validator built once at import instead of per response
+_schedules_adapter = TypeAdapter(List[RecordingScheduleResponse])
+
+
+def _running_scheduler() -> Optional[SchedulerServiceV2]:
+    """Scheduler service if it is running, else None"""
+    scheduler_service = get_service_container().get_scheduler_service()
+    return scheduler_service if scheduler_service.is_running() else None
+
 
 @router.get("", response_model=List[RecordingScheduleResponse])
 async def get_schedules(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get list of recording schedules with rotation policies
     """
+    # Validate client cache against a single aggregate query
+    version = await db.execute(
+        select(func.max(RecordingSchedule.updated_at), func.count(RecordingSchedule.id))
+    )
+    last_modified, total = version.one()
+    etag = make_etag("schedules", last_modified, total)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    apply_cache_headers(response, etag, last_modified)
+    
+    # Responses carry no relationships; raiseload turns any accidental lazy load (N+1) into an error
     result = await db.execute(
         select(RecordingSchedule)
+        .options(load_only(*SCHEDULE_LIST_COLUMNS), raiseload("*"))
         .order_by(RecordingSchedule.created_at.desc())
     )
     schedules = result.scalars().all()
     
-    return schedules
+    return _schedules_adapter.validate_python(schedules, from_attributes=True)
 
 
 @router.post("", response_model=RecordingScheduleResponse)
 async def create_schedule(
     schedule_data: RecordingScheduleCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Create new recording schedule
     """
-    # Check for duplicate schedule
-    result = await db.execute(
-        select(RecordingSchedule)
-        .where(
-            RecordingSchedule.platform == schedule_data.platform,
-            RecordingSchedule.streamer_id == schedule_data.streamer_id
-        )
-    )
-    existing_schedule = result.scalar_one_or_none()
-    
-    if existing_schedule:
+    # Create new schedule (INSERT ... RETURNING hydrates it without a refresh);
+    # the (platform, streamer_id) unique constraint rejects duplicates without a pre-SELECT
+    try:
+        schedule = await ScheduleRepository(db).create(schedule_data.model_dump())
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Schedule for {schedule_data.platform}/{schedule_data.streamer_id} already exists"
         )
     
-    # Create new schedule
-    schedule = RecordingSchedule(**schedule_data.model_dump())
-    db.add(schedule)
-    await db.commit()
-    await db.refresh(schedule)
-    
-    # Add to scheduler service if it's enabled
-    if schedule.enabled:
-        from app.core.service_container import get_service_container
-        service_container = get_service_container()
-        scheduler_service = service_container.get_scheduler_service()
-        if scheduler_service and scheduler_service.is_running():
-            await scheduler_service._start_monitoring(schedule)
+    # Add to scheduler service if it's enabled (after the response is sent)
+    if schedule.enabled and (scheduler_service := _running_scheduler()):
+        background_tasks.add_task(scheduler_service._start_monitoring, schedule)
     
     
-    return schedule
+    return RecordingScheduleResponse.model_validate(schedule)
 
 
 @router.get("/{schedule_id}", response_model=RecordingScheduleResponse)
 async def get_schedule(
     schedule_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -90,6 +108,7 @@ async def get_schedule(
     """
     result = await db.execute(
         select(RecordingSchedule)
+        .options(raiseload("*"))
         .where(RecordingSchedule.id == schedule_id)
     )
     schedule = result.scalar_one_or_none()
@@ -100,23 +119,36 @@ async def get_schedule(
             detail="Schedule not found"
         )
     
-    return schedule
+    last_modified = schedule.updated_at or schedule.created_at
+    etag = make_etag("schedule", schedule.id, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    apply_cache_headers(response, etag, last_modified)
+    
+    return RecordingScheduleResponse.model_validate(schedule)
 
 
 @router.put("/{schedule_id}", response_model=RecordingScheduleResponse)
 async def update_schedule(
     schedule_id: int,
     schedule_data: RecordingScheduleUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update recording schedule
     """
-    result = await db.execute(
-        select(RecordingSchedule).where(RecordingSchedule.id == schedule_id)
-    )
-    schedule = result.scalar_one_or_none()
+    # Update fields and fetch the updated row in one statement
+    values = schedule_data.model_dump(exclude_unset=True)
+    try:
+        schedule = await ScheduleRepository(db).update_fields(schedule_id, values)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Schedule for this platform/streamer already exists"
+        )
     
     if not schedule:
         raise HTTPException(
@@ -124,22 +156,14 @@ async def update_schedule(
             detail="Schedule not found"
         )
     
-    # Update fields
-    for field, value in schedule_data.model_dump(exclude_unset=True).items():
-        setattr(schedule, field, value)
-    
     await db.commit()
-    await db.refresh(schedule)
     
-    # Update scheduler service
-    from app.core.service_container import get_service_container
-    service_container = get_service_container()
-    scheduler_service = service_container.get_scheduler_service()
-    if scheduler_service and scheduler_service.is_running():
-        await scheduler_service._start_monitoring(schedule)
+    # Update scheduler service after the response is sent (restarts only if the loop can't pick up the change)
+    if scheduler_service := _running_scheduler():
+        background_tasks.add_task(scheduler_service.refresh_monitoring, schedule, values)
     
     
-    return schedule
+    return RecordingScheduleResponse.model_validate(schedule)
 
 
 @router.delete("/{schedule_id}")
@@ -151,43 +175,38 @@ async def delete_schedule(
     """
     Delete recording schedule
     """
-    result = await db.execute(
-        select(RecordingSchedule).where(RecordingSchedule.id == schedule_id)
-    )
-    schedule = result.scalar_one_or_none()
+    # Single DELETE ... RETURNING doubles as the existence check
+    deleted = await ScheduleRepository(db).delete(schedule_id)
     
-    if not schedule:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Schedule not found"
         )
     
-    # Remove from scheduler service
-    from app.core.service_container import get_service_container
-    service_container = get_service_container()
-    scheduler_service = service_container.get_scheduler_service()
-    if scheduler_service and scheduler_service.is_running():
-        await scheduler_service.stop_monitoring(schedule.id)
-    
-    await db.delete(schedule)
     await db.commit()
     
+    # Remove from scheduler service
+    if scheduler_service := _running_scheduler():
+        await scheduler_service.stop_monitoring(schedule_id)
+    
     return {"message": "Schedule deleted successfully"}
 
 
 @router.post("/{schedule_id}/toggle")
 async def toggle_schedule(
     schedule_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Toggle schedule enabled status
     """
-    result = await db.execute(
-        select(RecordingSchedule).where(RecordingSchedule.id == schedule_id)
+    # Flip the flag and read back the row in a single UPDATE ... RETURNING
+    schedule = await ScheduleRepository(db).update_fields(
+        schedule_id, {"enabled": not_(RecordingSchedule.enabled)}
     )
-    schedule = result.scalar_one_or_none()
     
     if not schedule:
         raise HTTPException(
@@ -195,19 +214,14 @@ async def toggle_schedule(
             detail="Schedule not found"
         )
     
-    schedule.enabled = not schedule.enabled
     await db.commit()
-    await db.refresh(schedule)
     
-    # Update scheduler service
-    from app.core.service_container import get_service_container
-    service_container = get_service_container()
-    scheduler_service = service_container.get_scheduler_service()
-    if scheduler_service and scheduler_service.is_running():
+    # Update scheduler service (after the response is sent)
+    if scheduler_service := _running_scheduler():
         if schedule.enabled:
-            await scheduler_service._start_monitoring(schedule)
+            background_tasks.add_task(scheduler_service.refresh_monitoring, schedule, ("enabled",))
         else:
-            await scheduler_service.stop_monitoring(schedule.id)
+            background_tasks.add_task(scheduler_service.stop_monitoring, schedule.id)
     
     return {
         "message": f"Schedule {'enabled' if schedule.enabled else 'disabled'}",
@@ -1,23 +1,33 @@
 """
 System API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from typing import List
-import psutil
+import asyncio
+import logging
 import os
 from datetime import datetime
 import time
 
 from app.database.database import get_db
-from app.database.models import SystemConfig, User
+from app.database.models import User
 from app.core.auth import get_current_user
 from app.core.config import settings
-from app.core.logging import logging_config
+from app.core.http_cache import etag_json_response
+from app.core.service_container import get_service_container
+from app.core.logging import logging_config, count_lines, read_tail_lines
+from app.core import config_cache, system_stats
+from app.repositories.system_config_repository import SystemConfigRepository
 from pydantic import BaseModel, validator
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Process timezone info is fixed at startup, so resolve it once
+_TZ_OFFSET = time.timezone
+_TZ_NAME = time.tzname[1] if time.daylight else time.tzname[0]
 
 
 class MonitoringIntervalRequest(BaseModel):
@@ -67,25 +77,28 @@ async def get_server_time():
     return {
         "current_time": now.isoformat(),
         "timestamp": now.timestamp(),
-        "timezone_offset": time.timezone,
-        "timezone_name": time.tzname[0] if not time.daylight else time.tzname[1]
+        "timezone_offset": _TZ_OFFSET,
+        "timezone_name": _TZ_NAME
     }
 
 
 @router.get("/status")
 async def get_system_status(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
     Get system status information
+
+    Polling clients that send If-None-Match get an empty 304 while the numbers are unchanged.
     """
     # Disk usage
-    disk_usage = psutil.disk_usage(settings.RECORDINGS_DIR)
+    disk_usage = await system_stats.get_disk_usage(settings.RECORDINGS_DIR)
     
     # Memory usage
-    memory = psutil.virtual_memory()
+    memory = await system_stats.get_virtual_memory()
     
-    return {
+    return etag_json_response(request, {
         "disk": {
             "total": disk_usage.total,
             "used": disk_usage.used,
@@ -99,26 +112,26 @@ async def get_system_status(
         },
         "recordings_dir": settings.RECORDINGS_DIR,
         "max_file_size": settings.MAX_FILE_SIZE
-    }
+    })
 
 
 @router.get("/config")
 async def get_system_config(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get system configuration"""
-    result = await db.execute(select(SystemConfig))
-    configs = result.scalars().all()
+    configs = await config_cache.get_all(db)
     
     config_dict = {}
-    for config in configs:
-        config_dict[config.config_key] = {
-            'value': config.config_value,
-            'description': config.description
+    for key, (value, description) in configs.items():
+        config_dict[key] = {
+            'value': value,
+            'description': description
         }
     
-    return config_dict
+    return etag_json_response(request, config_dict)
 
 
 @router.post("/config/{key}")
@@ -133,38 +146,24 @@ async def set_system_config(
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Check if config exists
-    result = await db.execute(select(SystemConfig).where(SystemConfig.config_key == key))
-    config = result.scalar_one_or_none()
-    
-    if config:
-        config.config_value = value
-        if description:
-            config.description = description
-    else:
-        config = SystemConfig(
-            config_key=key,
-            config_value=value,
-            description=description
-        )
-        db.add(config)
-    
+    # Insert or update in one statement (description is only overwritten when provided)
+    await SystemConfigRepository(db).upsert(
+        [{"config_key": key, "config_value": value, "description": description}],
+        update_columns=("config_value", "description") if description else ("config_value",)
+    )
     await db.commit()
-    await db.refresh(config)
+    config_cache.invalidate()
     
     return {"message": "Configuration updated", "key": key, "value": value}
 
 
 @router.post("/rotation/apply")
 async def trigger_rotation_cleanup(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Trigger immediate rotation cleanup
     """
-    from app.core.service_container import get_service_container
-
     # Use the global service container to get SchedulerServiceV2
     service_container = get_service_container()
     scheduler_service = service_container.get_scheduler_service()
@@ -186,15 +185,13 @@ async def get_monitoring_interval(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current monitoring interval setting"""
-    result = await db.execute(
-        select(SystemConfig).where(SystemConfig.config_key == "monitoring_interval")
-    )
-    config = result.scalar_one_or_none()
+    config = await config_cache.get(db, "monitoring_interval")
     
     if config:
+        value, description = config
         return {
-            "interval_seconds": int(config.config_value),
-            "description": config.description
+            "interval_seconds": int(value),
+            "description": description
         }
     else:
         # Return default value if not set
@@ -214,25 +211,17 @@ async def set_monitoring_interval(
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Check if config exists
-    result = await db.execute(
-        select(SystemConfig).where(SystemConfig.config_key == "monitoring_interval")
+    # Insert or update in one statement
+    await SystemConfigRepository(db).upsert(
+        [{
+            "config_key": "monitoring_interval",
+            "config_value": str(request.interval_seconds),
+            "description": f"Stream monitoring interval in seconds (set to {request.interval_seconds}s)"
+        }],
+        update_columns=("config_value", "description")
     )
-    config = result.scalar_one_or_none()
-    
-    if config:
-        config.config_value = str(request.interval_seconds)
-        config.description = f"Stream monitoring interval in seconds (set to {request.interval_seconds}s)"
-    else:
-        config = SystemConfig(
-            config_key="monitoring_interval",
-            config_value=str(request.interval_seconds),
-            description=f"Stream monitoring interval in seconds (set to {request.interval_seconds}s)"
-        )
-        db.add(config)
-    
     await db.commit()
-    await db.refresh(config)
+    config_cache.invalidate()
     
     # TODO: Update scheduler service with new interval
     # This would require restarting or reconfiguring the scheduler
@@ -292,22 +281,13 @@ async def update_logging_config(
         "log_category_error": str(request.categories.get("error", True)),
     }
     
-    # Update all logging configs
-    for key, value in config_map.items():
-        result = await db.execute(select(SystemConfig).where(SystemConfig.config_key == key))
-        config = result.scalar_one_or_none()
-        
-        if config:
-            config.config_value = value
-        else:
-            config = SystemConfig(
-                config_key=key,
-                config_value=value,
-                description=f"Logging configuration: {key}"
-            )
-            db.add(config)
-    
+    # Update all logging configs with one multi-row upsert
+    await SystemConfigRepository(db).upsert([
+        {"config_key": key, "config_value": value, "description": f"Logging configuration: {key}"}
+        for key, value in config_map.items()
+    ])
     await db.commit()
+    config_cache.invalidate()
     
     return {
         "message": "Logging configuration updated successfully",
@@ -324,7 +304,7 @@ async def get_log_files(
         raise HTTPException(status_code=403, detail="Admin access required")
     
     try:
-        log_files = logging_config.get_log_files()
+        log_files = await asyncio.to_thread(logging_config.get_log_files)
         return {
             "log_files": log_files,
             "logs_directory": str(logging_config.logs_dir)
@@ -340,41 +320,48 @@ async def get_log_files(
 async def get_log_file_content(
     filename: str,
     lines: int = 100,
+    include_total: bool = True,
     current_user: User = Depends(get_current_user)
 ):
-    """Get log file content (tail n lines)"""
+    """Get log file content (tail n lines)
+
+    Only the tail is read from disk; pass include_total=false to also skip the full-file line count.
+    """
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    log_file_path = logging_config.logs_dir / filename
-    
-    if not log_file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Log file '{filename}' not found"
-        )
-    
     # Security check - only allow files in logs directory
-    if not str(log_file_path).startswith(str(logging_config.logs_dir)):
+    log_file_path = logging_config.resolve_log_file(filename)
+    if log_file_path is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
     
+    if not await asyncio.to_thread(log_file_path.is_file):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Log file '{filename}' not found"
+        )
+    
     try:
-        # Read last n lines
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            file_lines = f.readlines()
-            
-        # Get last n lines
-        tail_lines = file_lines[-lines:] if len(file_lines) > lines else file_lines
+        # Read last n lines backwards from EOF instead of loading the whole file
+        tail_lines = await asyncio.to_thread(read_tail_lines, log_file_path, 0, lines)
         
-        return {
+        total_lines = None
+        if include_total:
+            stat = await asyncio.to_thread(log_file_path.stat)
+            total_lines = await asyncio.to_thread(
+                count_lines, str(log_file_path), stat.st_mtime_ns, stat.st_size
+            )
+        
+        # Returning the response directly skips the jsonable_encoder walk over every line
+        return ORJSONResponse({
             "filename": filename,
-            "total_lines": len(file_lines),
+            "total_lines": total_lines,
             "showing_lines": len(tail_lines),
             "content": tail_lines
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -398,7 +385,7 @@ async def cleanup_old_logs(
         )
     
     try:
-        cleaned_files = logging_config.clean_old_logs(max_age_days)
+        cleaned_files = await asyncio.to_thread(logging_config.clean_old_logs, max_age_days)
         return {
             "message": f"Log cleanup completed",
             "cleaned_files_count": len(cleaned_files),
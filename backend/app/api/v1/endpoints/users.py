@@ -4,33 +4,28 @@ Users API endpoints
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import load_only
 from typing import List
 
 from app.database.database import get_db
 from app.database.models import User
 from app.core.auth import get_current_admin_user
+from app.schemas.user import UserResponse
 
 router = APIRouter()
 
 
-@router.get("/me")
+@router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get current user information
     """
-    return {
-        "id": current_user.id,
-        "username": current_user.username,
-        "is_admin": current_user.is_admin,
-        "is_active": current_user.is_active,
-        "created_at": current_user.created_at,
-        "last_login": current_user.last_login
-    }
+    return current_user
 
 
-@router.get("/", response_model=List[dict])
+@router.get("/", response_model=List[UserResponse])
 async def get_users(
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
@@ -38,17 +33,12 @@ async def get_users(
     """
     Get list of users (admin only)
     """
-    result = await db.execute(select(User))
-    users = result.scalars().all()
+    # Only the response columns (keeps password hashes out of the result set)
+    result = await db.execute(
+        select(User).options(load_only(
+            User.id, User.username, User.is_admin, User.is_active, User.created_at, User.last_login
+        ))
+    )
     
-    return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "is_admin": user.is_admin,
-            "is_active": user.is_active,
-            "created_at": user.created_at,
-            "last_login": user.last_login
-        }
-        for user in users
-    ]
+    # response_model validates the ORM rows directly (from_attributes)
+    return result.scalars().all()
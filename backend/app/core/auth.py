@@ -4,20 +4,97 @@ Authentication module for JWT
 from fastapi import HTTPException, Depends, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+import asyncio
+import hashlib
+import secrets
+import time
 
 from app.database.database import get_db
 from app.database.models import User
+from app.core.config import settings
 from app.core.jwt import get_current_user_from_token
 
+# Argon2id hasher (OWASP recommended parameters)
+PH = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
+# Recently authenticated users, keyed by user_id: (expires_at, column values).
+# Lets get_current_user skip the users SELECT on most requests; endpoints that
+# modify a user must call invalidate_user() after committing.
+_USER_CACHE_TTL = 60.0
+_USER_CACHE_SIZE = 5000
+_USER_CACHE_FIELDS = ("id", "username", "is_admin", "is_active", "created_at", "last_login")
+_user_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
 
-async def get_current_user(
-    authorization: Optional[str] = Header(None),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+
+def _is_legacy_hash(password_hash: str) -> bool:
+    """Check whether hash is a legacy unsalted SHA-256 hex digest"""
+    return not password_hash.startswith("$argon2")
+
+
+def hash_password(password: str) -> str:
     """
-    Get current authenticated user from JWT token only
+    Hash password with Argon2id
+    """
+    return PH.hash(password)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """
+    Verify password against stored hash (Argon2id or legacy SHA-256)
+    """
+    if _is_legacy_hash(password_hash):
+        legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+        return secrets.compare_digest(password_hash, legacy_hash)
+
+    try:
+        return PH.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether stored hash should be upgraded to current Argon2id parameters
+    """
+    return _is_legacy_hash(password_hash) or PH.check_needs_rehash(password_hash)
+
+
+async def ensure_admin_user(db: AsyncSession, last_login: Optional[datetime] = None) -> User:
+    """
+    Get or create the default admin account configured by BASIC_AUTH_* settings
+
+    When last_login is given it is recorded in the same transaction.
+    """
+    result = await db.execute(
+        select(User).where(User.username == settings.BASIC_AUTH_USERNAME).limit(1)
+    )
+    admin_user = result.scalar_one_or_none()
+    if admin_user:
+        if last_login is not None:
+            admin_user.last_login = last_login
+            await db.commit()
+        return admin_user
+
+    password_hash = await asyncio.to_thread(hash_password, settings.BASIC_AUTH_PASSWORD)
+    admin_user = User(
+        username=settings.BASIC_AUTH_USERNAME,
+        password_hash=password_hash,
+        is_admin=True,
+        is_active=True,
+        last_login=last_login
+    )
+    db.add(admin_user)
+    await db.commit()
+    return admin_user
+
+
+def extract_bearer_token(authorization: Optional[str]) -> str:
+    """
+    Extract token from "Bearer <token>" Authorization header
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -25,9 +102,18 @@ async def get_current_user(
             detail="Bearer token required",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    token = authorization.split(" ")[1]
-    user_info = get_current_user_from_token(token)
+    return authorization[7:]
+
+
+async def get_current_user(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token only
+    """
+    token = extract_bearer_token(authorization)
+    user_info = await get_current_user_from_token(token)
     
     if not user_info:
         raise HTTPException(
@@ -35,21 +121,47 @@ async def get_current_user(
             detail="Invalid or expired JWT token"
         )
     
+    user_id = user_info["user_id"]
+    cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > time.monotonic():
+        # Transient copy; callers only read identity/role attributes
+        return User(**cached[1])
+
     # Get user from database
     result = await db.execute(
-        select(User).where(User.id == user_info["user_id"])
+        select(User).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
     
     if not user or not user.is_active:
+        invalidate_user(user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive"
         )
     
+    _cache_user(user)
     return user
 
 
+def _cache_user(user: User) -> None:
+    """Store a snapshot of user columns for get_current_user"""
+    if len(_user_cache) >= _USER_CACHE_SIZE:
+        now = time.monotonic()
+        for user_id in [user_id for user_id, (expires_at, _) in _user_cache.items() if expires_at <= now]:
+            del _user_cache[user_id]
+        if len(_user_cache) >= _USER_CACHE_SIZE:
+            _user_cache.pop(next(iter(_user_cache)))
+
+    values = {field: getattr(user, field) for field in _USER_CACHE_FIELDS}
+    _user_cache[user.id] = (time.monotonic() + _USER_CACHE_TTL, values)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a cached user after its row has been modified"""
+    _user_cache.pop(user_id, None)
+
+
 async def get_current_admin_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -22,12 +22,23 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = f"sqlite+aiosqlite:///{APP_DATA_DIR}/database/streamlink_dashboard.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a pooled connection is replaced
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection before failing the request
+    DB_ECHO: bool = False  # SQL statement logging (sqlalchemy.engine is also enabled at DEBUG log level)
+    
+    # Worker threads for blocking file/psutil calls made via asyncio.to_thread
+    IO_THREAD_POOL_SIZE: int = 8
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Token revocation store (in-process fallback when unset)
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001", "http://localhost:8080"]
     
@@ -71,6 +82,7 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+        frozen = True
 
 
 # Create settings instance
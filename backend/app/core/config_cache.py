@@ -0,0 +1,66 @@
+"""
+Per-process cache of SystemConfig rows
+
+System configuration is read on every settings page poll but only changes on
+admin writes, so all rows are loaded once and served from memory until a write
+endpoint calls invalidate() after committing. invalidate() only reaches the
+current process, so entries also expire after CACHE_TTL seconds to bound how
+long other workers can serve stale values.
+"""
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import SystemConfig
+
+# Seconds loaded entries stay fresh
+CACHE_TTL = 5.0
+
+# config_key -> (config_value, description)
+_cache: Dict[str, Tuple[str, Optional[str]]] = {}
+_loaded = False
+_loaded_at = 0.0
+_generation = 0
+_lock = asyncio.Lock()
+
+
+async def get_all(db: AsyncSession) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Get all config entries, (re)loading them with one SELECT when missing or expired"""
+    global _cache, _loaded, _loaded_at
+    if _loaded and time.monotonic() - _loaded_at < CACHE_TTL:
+        return _cache
+
+    async with _lock:
+        # Another request may have reloaded the entries while we waited
+        if _loaded and time.monotonic() - _loaded_at < CACHE_TTL:
+            return _cache
+
+        generation = _generation
+        result = await db.execute(
+            select(SystemConfig.config_key, SystemConfig.config_value, SystemConfig.description)
+        )
+        entries = {key: (value, description) for key, value, description in result.all()}
+
+        # A write committed while we were reading; serve this snapshot but reload next time
+        if generation != _generation:
+            return entries
+
+        _cache = entries
+        _loaded = True
+        _loaded_at = time.monotonic()
+        return _cache
+
+
+async def get(db: AsyncSession, key: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Get a single (value, description) entry, or None if unset"""
+    return (await get_all(db)).get(key)
+
+
+def invalidate():
+    """Drop cached entries after a committed SystemConfig write"""
+    global _loaded, _generation
+    _generation += 1
+    _loaded = False
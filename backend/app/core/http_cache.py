@@ -0,0 +1,92 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified)
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response, status
+
+# Clients must revalidate every time, but a matching validator costs only a 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from arbitrary version parts (ids, timestamps, counts, bytes)
+
+    Weak because the same tag covers both the gzip and identity encodings of a body.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode())
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak indicator for weak comparison (RFC 9110 8.8.3.2)"""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _to_utc(dt: datetime) -> datetime:
+    """Normalize a datetime to UTC (naive values are treated as local time)"""
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Check conditional request headers against the current validators
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison
+        client_etags = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+        return _opaque_tag(etag) in client_etags or "*" in client_etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _to_utc(last_modified) <= since
+
+    return False
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    """Validator headers for a cacheable response"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def apply_cache_headers(response: Response, etag: str, last_modified: Optional[datetime] = None):
+    """Attach validator headers to an outgoing response"""
+    response.headers.update(cache_headers(etag, last_modified))
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """Empty 304 response carrying the current validators"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, last_modified))
+
+
+def cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """Return serialized JSON bytes, or 304 Not Modified when the client already has them"""
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return Response(content=content, media_type="application/json", headers=cache_headers(etag))
+
+
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """Serialize a payload and validate it against If-None-Match using a hash of the body"""
+    content = orjson.dumps(payload)
+    return cached_json_response(request, content, make_etag(content))
@@ -1,100 +1,227 @@
 """
 JWT token handling utilities
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 from fastapi import HTTPException, status
+from collections import OrderedDict
+import hashlib
 import secrets
-from typing import Set
+import time
+from typing import Tuple
 
 from app.core.config import settings
 
-# In-memory token blacklist (for demo - use Redis in production)
-_token_blacklist: Set[str] = set()
+# Token settings are fixed for the process lifetime; bind them once at import
+_SECRET = settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_ALG_LIST = [_ALG]
+_EXP_MIN = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
-def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# In-process token revocation (used when REDIS_URL is not configured).
+# Both maps hold jti -> exp timestamp so entries can be dropped once the token expires anyway.
+_token_blacklist: Dict[str, float] = {}
+_user_tokens: Dict[int, Dict[str, float]] = {}
+
+# Redis key layout for token revocation
+REVOKED_KEY = "auth:revoked:{jti}"
+USER_JTIS_KEY = "auth:user_jtis:{user_id}"
+
+_redis_client = None
+
+# Decoded payloads of recently verified tokens, keyed by a token digest.
+# Entries live at most _VERIFY_CACHE_TTL seconds and never past the token's own exp;
+# revocation is still checked on every call.
+_VERIFY_CACHE_TTL = 30.0
+_VERIFY_CACHE_SIZE = 10_000
+_verify_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def get_redis():
+    """
+    Get shared Redis client, or None when Redis is not configured
+    """
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL and aioredis is not None:
+        _redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def _prune_expired(entries: Dict[str, float]) -> None:
+    """Drop jti entries whose tokens have already expired"""
+    now = time.time()
+    for jti in [jti for jti, exp in entries.items() if exp <= now]:
+        del entries[jti]
+
+
+def _remaining_ttl(payload: Dict[str, Any]) -> int:
+    """Seconds until token expiry (falls back to configured lifetime)"""
+    exp = payload.get("exp")
+    if exp is None:
+        return _EXP_MIN * 60
+    return int(exp) - int(time.time())
+
+
+def create_access_token(
+    data: Dict[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    now: Optional[datetime] = None
+) -> str:
     """
     Create JWT access token
+
+    Pass `now` to derive exp from the same instant as other claims (e.g. iat).
     """
     to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.now() + expires_delta
-    else:
-        expire = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=_EXP_MIN))
+
     to_encode.update({"exp": expire})
-    to_encode.update({"jti": secrets.token_urlsafe(32)})  # JWT ID for blacklisting
-    
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    to_encode.setdefault("jti", secrets.token_urlsafe(32))  # JWT ID for blacklisting
+
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=_ALG)
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[Dict[str, Any]]:
+def _decode_cached(token: str) -> Optional[Dict[str, Any]]:
+    """Decode and verify a token signature, reusing recent results for the same token"""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+
+    cached = _verify_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            return cached[1]
+        del _verify_cache[key]
+
+    try:
+        payload = jwt.decode(token, _SECRET, algorithms=_ALG_LIST)
+    except JWTError:
+        return None
+
+    exp = payload.get("exp")
+    expires_at = now + _VERIFY_CACHE_TTL if exp is None else min(now + _VERIFY_CACHE_TTL, float(exp))
+    _verify_cache[key] = (expires_at, payload)
+    if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+        _verify_cache.popitem(last=False)
+    return payload
+
+
+async def is_token_revoked(jti: str) -> bool:
+    """
+    Check whether token ID has been revoked
+    """
+    redis = get_redis()
+    if redis is not None:
+        return bool(await redis.exists(REVOKED_KEY.format(jti=jti)))
+    return jti in _token_blacklist
+
+
+async def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify JWT token and return payload if valid
     """
-    try:
-        # Check if token is blacklisted
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        jti = payload.get("jti")
-        
-        if jti and jti in _token_blacklist:
-            return None
-            
-        return payload
-        
-    except JWTError:
+    payload = _decode_cached(token)
+    if payload is None:
+        return None
+
+    # Check if token is blacklisted
+    jti = payload.get("jti")
+    if jti and await is_token_revoked(jti):
         return None
 
+    return payload
+
 
-def blacklist_token(token: str) -> bool:
+async def blacklist_token(token: str) -> bool:
     """
     Add token to blacklist (for logout/password change)
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        jti = payload.get("jti")
-        
-        if jti:
-            _token_blacklist.add(jti)
-            return True
-            
+        payload = jwt.decode(token, _SECRET, algorithms=_ALG_LIST)
     except JWTError:
-        pass
-    
-    return False
+        return False
+
+    jti = payload.get("jti")
+    if not jti:
+        return False
+
+    redis = get_redis()
+    if redis is not None:
+        ttl = _remaining_ttl(payload)
+        if ttl > 0:
+            await redis.set(REVOKED_KEY.format(jti=jti), "1", ex=ttl)
+    else:
+        _prune_expired(_token_blacklist)
+        _token_blacklist[jti] = time.time() + _remaining_ttl(payload)
+
+    return True
 
 
-def clear_user_tokens(user_id: int) -> int:
+async def clear_user_tokens(user_id: int) -> int:
     """
-    Clear all tokens for a specific user (for password change)
-    This is a simplified implementation - in production you'd store user_id with jti
+    Revoke all issued tokens for a specific user (for password change)
     """
-    # For now, just clear all tokens (since we don't track user_id per token)
-    # In production, maintain a mapping of user_id -> [jti] 
-    cleared_count = len(_token_blacklist)
-    _token_blacklist.clear()
-    return cleared_count
+    redis = get_redis()
+    if redis is not None:
+        index_key = USER_JTIS_KEY.format(user_id=user_id)
+        jtis = await redis.smembers(index_key)
+        ttl = _EXP_MIN * 60
+
+        # Revoke everything in a single round-trip
+        async with redis.pipeline(transaction=False) as pipe:
+            for jti in jtis:
+                pipe.set(REVOKED_KEY.format(jti=jti), "1", ex=ttl)
+            pipe.delete(index_key)
+            await pipe.execute()
+        return len(jtis)
+
+    jtis = _user_tokens.pop(user_id, {})
+    _prune_expired(_token_blacklist)
+    _token_blacklist.update(jtis)
+    return len(jtis)
+
+
+async def _register_user_token(user_id: int, jti: str) -> None:
+    """Track issued token ID per user so it can be bulk-revoked"""
+    redis = get_redis()
+    if redis is not None:
+        index_key = USER_JTIS_KEY.format(user_id=user_id)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(index_key, jti)
+            pipe.expire(index_key, _EXP_MIN * 60)
+            await pipe.execute()
+    else:
+        user_jtis = _user_tokens.setdefault(user_id, {})
+        _prune_expired(user_jtis)
+        user_jtis[jti] = time.time() + _EXP_MIN * 60
 
 
-def get_current_user_from_token(token: str) -> Optional[Dict[str, Any]]:
+async def get_current_user_from_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Extract user information from valid token
     """
-    payload = verify_token(token)
+    payload = await verify_token(token)
     if not payload:
         return None
-    
+
     # Extract user info from token payload
     user_id = payload.get("sub")
-    username = payload.get("username") 
+    username = payload.get("username")
     is_admin = payload.get("is_admin", False)
-    
+
     if not user_id:
         return None
-        
+
     return {
         "user_id": int(user_id),
         "username": username,
@@ -102,15 +229,20 @@ def get_current_user_from_token(token: str) -> Optional[Dict[str, Any]]:
     }
 
 
-def create_user_token(user_id: int, username: str, is_admin: bool = False) -> str:
+async def create_user_token(user_id: int, username: str, is_admin: bool = False) -> str:
     """
     Create JWT token for a specific user
     """
+    jti = secrets.token_urlsafe(32)
+    now = datetime.now(timezone.utc)
     token_data = {
         "sub": str(user_id),
         "username": username,
         "is_admin": is_admin,
-        "iat": datetime.now()
+        "iat": now,
+        "jti": jti
     }
-    
-    return create_access_token(token_data)
\ No newline at end of file
+
+    token = create_access_token(token_data, now=now)
+    await _register_user_token(user_id, jti)
+    return token
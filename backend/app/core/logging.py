@@ -4,14 +4,32 @@ Provides file-based logging with categorization, rotation, and filtering
 """
 import logging
 import logging.handlers
+import atexit
+import copy
 import os
-import json
+import queue
+import re
+import functools
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+import orjson
+
 from app.core.config import settings
 
+# Block size for binary log scans
+LOG_READ_BLOCK_SIZE = 64 * 1024
+
+# Block size for newline counting
+LINE_COUNT_BLOCK_SIZE = 1024 * 1024
+
+# Level name -> numeric level
+_LEVEL_MAP = {
+    name: getattr(logging, name)
+    for name in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "FATAL", "CRITICAL")
+}
+
 
 class CategoryFilter(logging.Filter):
     """Filter logs based on category patterns"""
@@ -21,25 +39,40 @@ class CategoryFilter(logging.Filter):
         self.category = category
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        # One precompiled alternation per pattern list: a single scan per string
+        # instead of a Python-level loop over patterns
+        self._include = self._compile(self.include_patterns)
+        self._exclude = self._compile(self.exclude_patterns)
+
+    @staticmethod
+    def _compile(patterns: list) -> Optional[re.Pattern]:
+        """Compile literal patterns into a lowercase alternation, or None if empty"""
+        if not patterns:
+            return None
+        return re.compile("|".join(re.escape(pattern.lower()) for pattern in patterns))
     
     def filter(self, record):
         """Filter log records based on patterns"""
+        if self._include is None and self._exclude is None:
+            return True
+
         logger_name = record.name.lower()
-        message = record.getMessage().lower()
         
         # Exclude patterns (highest priority)
-        for pattern in self.exclude_patterns:
-            if pattern.lower() in logger_name or pattern.lower() in message:
-                return False
-        
-        # Include patterns (if specified)
-        if self.include_patterns:
-            for pattern in self.include_patterns:
-                if pattern.lower() in logger_name or pattern.lower() in message:
-                    return True
+        if self._exclude is not None and self._exclude.search(logger_name):
+            return False
+
+        included = self._include is None or self._include.search(logger_name) is not None
+        if included and self._exclude is None:
+            return True
+
+        # Logger name alone can't decide; format the message only now
+        message = record.getMessage().lower()
+        if self._exclude is not None and self._exclude.search(message):
             return False
         
-        return True
+        # Include patterns (if specified)
+        return included or self._include.search(message) is not None
 
 
 class JSONFormatter(logging.Formatter):
@@ -48,7 +81,8 @@ class JSONFormatter(logging.Formatter):
     def format(self, record):
         """Format log record as JSON"""
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            # Local naive datetime; orjson renders it as isoformat() would
+            "timestamp": datetime.fromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -70,7 +104,21 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
             
-        return json.dumps(log_data, ensure_ascii=False)
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted
+
+    The stock prepare() formats on the caller's thread and folds the traceback
+    into msg, which strips exc_info before JSONFormatter can see it. Here each
+    listener-side handler formats with its own formatter instead.
+    """
+    
+    def prepare(self, record):
+        """Shallow-copy the record so other handlers can't affect the queued one"""
+        return copy.copy(record)
 
 
 class LoggingConfig:
@@ -105,6 +153,8 @@ class LoggingConfig:
         self.logs_dir = Path(settings.LOGS_DIR)
         self.logs_dir.mkdir(exist_ok=True)
         self.handlers: Dict[str, logging.Handler] = {}
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        atexit.register(self.stop_listener)
         
     def create_file_handler(self, category: str, level: str = "INFO") -> logging.Handler:
         """Create a rotating file handler for a category"""
@@ -124,7 +174,7 @@ class LoggingConfig:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        handler.setLevel(getattr(logging, level.upper()))
+        handler.setLevel(_LEVEL_MAP[level.upper()])
         
         # Add category filter
         if category in self.CATEGORIES:
@@ -154,7 +204,7 @@ class LoggingConfig:
         )
         
         handler.setFormatter(JSONFormatter())
-        handler.setLevel(getattr(logging, level.upper()))
+        handler.setLevel(_LEVEL_MAP[level.upper()])
         
         # Add category filter
         if category in self.CATEGORIES:
@@ -192,10 +242,12 @@ class LoggingConfig:
         
         # Configure root logger
         root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, log_level.upper()))
+        root_logger.setLevel(_LEVEL_MAP[log_level.upper()])
         
         # Clear existing handlers to avoid duplicates
         root_logger.handlers.clear()
+        self.stop_listener()
+        self.handlers.clear()
         
         # Always add console handler with reduced verbosity
         console_handler = logging.StreamHandler()
@@ -204,7 +256,7 @@ class LoggingConfig:
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        console_handler.setLevel(_LEVEL_MAP[log_level.upper()])
         
         # Filter console output to reduce noise
         console_filter = CategoryFilter(
@@ -222,18 +274,30 @@ class LoggingConfig:
                     
                 # Create file handler
                 file_handler = self.create_file_handler(category, log_level)
-                root_logger.addHandler(file_handler)
                 self.handlers[f"file_{category}"] = file_handler
                 
                 # Create JSON handler if enabled
                 if enable_json_logging:
                     json_handler = self.create_json_handler(category, log_level)
-                    root_logger.addHandler(json_handler)
                     self.handlers[f"json_{category}"] = json_handler
+
+            # File writes happen on a background listener thread; logging callers
+            # only enqueue the record
+            if self.handlers:
+                log_queue = queue.Queue(-1)
+                self.listener = logging.handlers.QueueListener(
+                    log_queue, *self.handlers.values(), respect_handler_level=True
+                )
+                root_logger.addHandler(DeferredQueueHandler(log_queue))
+                self.listener.start()
         
         # Setup database logging configuration
         self.setup_database_logging()
         
+        # watchfiles logs every detected change at INFO; since the log stream watches
+        # the logs directory, those lines would land in app.log and retrigger it
+        logging.getLogger("watchfiles").setLevel(logging.WARNING)
+        
         # Log configuration summary
         enabled_cats = [cat for cat, enabled in categories.items() if enabled]
         logging.info(f"Logging system initialized - Level: {log_level}, Categories: {enabled_cats}")
@@ -242,6 +306,22 @@ class LoggingConfig:
         if enable_json_logging:
             logging.info("JSON logging enabled for structured analysis")
     
+    def stop_listener(self) -> None:
+        """Flush queued records and stop the background file-logging thread"""
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = None
+        for handler in self.handlers.values():
+            handler.close()
+    
+    def resolve_log_file(self, filename: str) -> Optional[Path]:
+        """Resolve a log file name, or None if it escapes the logs directory (e.g. via '..' or symlinks)"""
+        candidate = (self.logs_dir / filename).resolve()
+        if not candidate.is_relative_to(self.logs_dir.resolve()):
+            return None
+        return candidate
+    
     def get_log_files(self) -> Dict[str, Dict[str, Any]]:
         """Get information about existing log files"""
         log_files = {}
@@ -289,6 +369,64 @@ class LoggingConfig:
 logging_config = LoggingConfig()
 
 
+@functools.lru_cache(maxsize=256)
+def count_lines(path: str, mtime_ns: int, size: int) -> int:
+    """Count lines in a file, cached per (path, mtime, size)"""
+    line_count = 0
+    last_byte = b"\n"
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(LINE_COUNT_BLOCK_SIZE)
+            if not block:
+                break
+            line_count += block.count(b"\n")
+            last_byte = block[-1:]
+
+    # Count trailing line without newline terminator
+    if last_byte != b"\n":
+        line_count += 1
+    return line_count
+
+
+def read_tail_lines(path: Path, skip: int, count: int) -> List[str]:
+    """
+    Read `count` lines ending `skip` lines before EOF, in file order.
+    Reads fixed-size blocks backwards so only the requested tail is loaded.
+    """
+    wanted = skip + count
+    newest_first: List[bytes] = []
+
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        has_content = position > 0
+        carry = b""
+        first_block = True
+
+        while position > 0 and len(newest_first) < wanted:
+            read_size = min(LOG_READ_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + carry
+
+            # Trailing newline does not start a new line
+            if first_block:
+                if chunk.endswith(b"\n"):
+                    chunk = chunk[:-1]
+                first_block = False
+
+            parts = chunk.split(b"\n")
+            carry = parts[0]
+            newest_first.extend(reversed(parts[1:]))
+
+        # Remaining carry is the first line of the file
+        if position == 0 and has_content and len(newest_first) < wanted:
+            newest_first.append(carry)
+
+    page = newest_first[skip:wanted]
+    page.reverse()
+    return [line.decode('utf-8', errors='replace').rstrip('\r') for line in page]
+
+
 def setup_logging(enable_file_logging: bool = True,
                  enable_json_logging: bool = False,
                  log_level: str = None,
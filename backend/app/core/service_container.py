@@ -1,6 +1,7 @@
 """
 Service Container for Dependency Injection
 """
+import asyncio
 import logging
 from typing import Optional
 
@@ -17,7 +18,17 @@ class ServiceContainer:
 
     def __init__(self):
         self._scheduler_service: Optional[SchedulerServiceV2] = None
+        self._started = False
+        self._lock = asyncio.Lock()
         self._session_factory = AsyncSessionLocal
+        self._uow_factory = lambda: AsyncSQLAlchemyUnitOfWork(self._session_factory)
+
+    async def initialize(self):
+        """Create service singletons once, from application startup"""
+        async with self._lock:
+            if self._scheduler_service is None:
+                logger.info("Creating SchedulerServiceV2 instance")
+                self._scheduler_service = SchedulerServiceV2(self._session_factory)
 
     def get_session_factory(self):
         """Get database session factory"""
@@ -25,32 +36,40 @@ class ServiceContainer:
 
     def get_uow_factory(self):
         """Get Unit of Work factory"""
-        return lambda: AsyncSQLAlchemyUnitOfWork(self._session_factory)
+        return self._uow_factory
 
     def get_recording_service(self, uow: AsyncSQLAlchemyUnitOfWork) -> RecordingService:
         """Get RecordingService instance with UoW"""
         return RecordingService(uow)
 
     def get_scheduler_service(self) -> SchedulerServiceV2:
-        """Get SchedulerService singleton instance"""
-        if self._scheduler_service is None:
-            logger.info("Creating new SchedulerServiceV2 instance")
-            self._scheduler_service = SchedulerServiceV2(self._session_factory)
-        return self._scheduler_service
+        """Get SchedulerService singleton instance (created by initialize())"""
+        scheduler = self._scheduler_service
+        if scheduler is None:
+            raise RuntimeError("Service container has not been initialized")
+        return scheduler
 
     async def start_services(self):
         """Start all services"""
-        logger.info("Starting services in container")
-        scheduler = self.get_scheduler_service()
-        await scheduler.start()
+        await self.initialize()
+        async with self._lock:
+            if self._started:
+                return
+            logger.info("Starting services in container")
+            await self._scheduler_service.start()
+            self._started = True
         logger.info("All services started successfully")
 
     async def stop_services(self):
         """Stop all services"""
-        logger.info("Stopping services in container")
-        if self._scheduler_service:
+        async with self._lock:
+            # The scheduler may also have been started from the API, so stop it
+            # whenever it exists rather than only after start_services()
+            if self._scheduler_service is None:
+                return
+            logger.info("Stopping services in container")
             await self._scheduler_service.stop()
-            self._scheduler_service = None
+            self._started = False
         logger.info("All services stopped successfully")
 
 
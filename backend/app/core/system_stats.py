@@ -0,0 +1,46 @@
+"""
+Short-lived cache for host resource samples (disk / memory)
+
+Dashboard clients poll system status constantly; concurrent and back-to-back
+requests within the TTL share one psutil sample instead of each hitting
+statvfs and /proc.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import psutil
+
+# Seconds a sample stays fresh
+SAMPLE_TTL = 2.0
+
+_samples: Dict[Tuple, Tuple[float, Any]] = {}
+_lock = asyncio.Lock()
+
+
+async def _cached_sample(key: Tuple, sampler: Callable[[], Any]) -> Any:
+    """Return a fresh-enough cached sample, taking a new one under the lock if needed"""
+    cached = _samples.get(key)
+    if cached and time.monotonic() - cached[0] < SAMPLE_TTL:
+        return cached[1]
+
+    async with _lock:
+        # Another request may have refreshed the sample while we waited
+        cached = _samples.get(key)
+        if cached and time.monotonic() - cached[0] < SAMPLE_TTL:
+            return cached[1]
+
+        # psutil hits statvfs and /proc synchronously; keep it off the event loop
+        value = await asyncio.to_thread(sampler)
+        _samples[key] = (time.monotonic(), value)
+        return value
+
+
+async def get_disk_usage(path: str):
+    """Cached psutil.disk_usage for a path"""
+    return await _cached_sample(("disk", path), lambda: psutil.disk_usage(path))
+
+
+async def get_virtual_memory():
+    """Cached psutil.virtual_memory"""
+    return await _cached_sample(("memory",), psutil.virtual_memory)
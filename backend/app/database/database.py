@@ -1,17 +1,36 @@
 """
 Database connection and session management
 """
+import asyncio
+import logging
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing import AsyncGenerator
 
 from app.core.config import settings
 
+# Connection pool settings for server databases. SQLite keeps SQLAlchemy's default pool:
+# connections are local file handles, so pre-ping and a large pre-opened pool add cost only.
+# Async engines must use AsyncAdaptedQueuePool; the sync QueuePool can deadlock the event loop.
+pool_options = {}
+if not settings.DATABASE_URL.startswith("sqlite"):
+    pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    echo=settings.DB_ECHO,
+    future=True,
+    **pool_options
 )
 
 # Create async session factory
@@ -47,6 +66,46 @@ async def init_db():
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def ensure_indexes():
+    """
+    Create indexes declared after a database was first created (create_all skips existing tables)
+
+    Unique indexes back duplicate checks the application no longer performs itself,
+    so failing to create one aborts startup instead of running without it.
+    """
+    from app.database.models import Base
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(index.create, checkfirst=True)
+            except Exception as e:
+                if index.unique:
+                    # e.g. existing duplicate rows block the index; they must be removed first
+                    raise RuntimeError(
+                        f"Could not create unique index {index.name} on {table.name}; "
+                        f"remove duplicate rows and restart: {e}"
+                    ) from e
+                logging.warning(f"Could not create index {index.name}: {e}")
+
+
+async def warm_up_pool():
+    """
+    Open pool_size connections up front so the first requests don't pay connection setup
+
+    No-op for SQLite, which uses the default pool.
+    """
+    if not pool_options:
+        return
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)))
+
+
 async def close_db():
     """
     Close database connections
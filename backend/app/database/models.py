@@ -6,7 +6,7 @@ from sqlalchemy.sql import func as sql_func
 from typing import Optional, Dict, Any
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, Text,
-    ForeignKey, JSON, Float, BigInteger
+    ForeignKey, JSON, Float, BigInteger, Index
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column, DeclarativeBase
 from sqlalchemy.sql import func
@@ -93,6 +93,11 @@ class RecordingSchedule(Base):
     recordings: Mapped[list["Recording"]] = relationship("Recording", back_populates="schedule")
     jobs: Mapped[list["RecordingJob"]] = relationship("RecordingJob", back_populates="schedule", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # One schedule per stream; also serves the duplicate check as an index probe
+        Index("uq_schedule_platform_streamer", "platform", "streamer_id", unique=True),
+    )
+
 
 class Recording(Base):
     """Recording file model"""
@@ -119,6 +124,15 @@ class Recording(Base):
     # Relationships
     schedule: Mapped[Optional["RecordingSchedule"]] = relationship("RecordingSchedule", back_populates="recordings")
 
+    __table_args__ = (
+        # Covers the recordings list filters plus its created_at ordering
+        Index("ix_recording_filter", "platform", "streamer_id", "is_favorite", "created_at"),
+    )
+
+
+# Unfiltered recordings list ordered by newest first (id breaks ties for keyset paging)
+Index("ix_recording_created_at_desc", Recording.created_at.desc(), Recording.id.desc())
+
 
 class RecordingJob(Base):
     """Recording job execution model"""
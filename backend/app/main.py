@@ -3,9 +3,12 @@ Streamlink Dashboard - FastAPI Main Application
 """
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
 import uvicorn
 from typing import Optional
@@ -14,6 +17,7 @@ import os
 import httpx
 import asyncio
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from app.core.config import settings, ensure_app_directories
 
@@ -36,9 +40,9 @@ setup_logging(
     categories=categories
 )
 
-from app.database.database import engine, get_db, AsyncSessionLocal
+from app.database.database import engine, get_db, AsyncSessionLocal, ensure_indexes, warm_up_pool
 from app.database.models import Base
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, ensure_admin_user
 from app.api.v1.api import api_router
 from app.core.service_container import get_service_container
 
@@ -48,6 +52,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     
     # Startup
+    # Dedicated pool for asyncio.to_thread (log/status I/O) so it doesn't compete with
+    # the anyio threadpool FastAPI uses for sync dependencies
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.IO_THREAD_POOL_SIZE, thread_name_prefix="io")
+    )
+    
     # Ensure all required directories exist before any database operations
     try:
         ensure_app_directories()
@@ -157,32 +167,28 @@ async def lifespan(app: FastAPI):
         # In test environment, tables might already be created
         logging.warning(f"Could not create database tables: {e}")
     
+    # Add indexes introduced after the database was created
+    await ensure_indexes()
+    
+    # Pre-open pooled database connections
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        logging.warning(f"Could not warm up database connection pool: {e}")
+    
     # Start Next.js server
     await start_nextjs()
     
     # Initialize service container and create default data
     try:
+        container = get_service_container()
+        await container.initialize()
+
         async with AsyncSessionLocal() as db:
-            # Create default admin user if not exists
-            from app.database.models import User
-            from sqlalchemy import select
-            result = await db.execute(select(User).where(User.username == "admin"))
-            admin_user = result.scalar_one_or_none()
-
-            if not admin_user:
-                import hashlib
-                password_hash = hashlib.sha256("admin123".encode()).hexdigest()
-                admin_user = User(
-                    username="admin",
-                    password_hash=password_hash,
-                    is_admin=True
-                )
-                db.add(admin_user)
-                await db.commit()
-                logging.info("Created default admin user (admin/admin123)")
+            # Create default admin user if not exists, so login never has to
+            admin_user = await ensure_admin_user(db)
+            logging.info(f"Default admin user ready ({admin_user.username})")
 
-        # Initialize service container
-        container = get_service_container()
         if settings.AUTO_START_SCHEDULER:
             await container.start_services()
             logging.info("Services started automatically")
@@ -246,7 +252,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes dict/datetime payloads several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Security
@@ -259,8 +267,63 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link"],
 )
 
+
+class APIGZipMiddleware(GZipMiddleware):
+    """
+    Gzip JSON API responses
+
+    Recording downloads (already-compressed video) pass through untouched, and so do
+    streamed bodies (NDJSON lists, log content): gzip would hold their chunks back
+    until a compression block fills.
+    """
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith("/api/") or path.endswith("/download"):
+            await self.app(scope, receive, send)
+            return
+        if "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_selectively(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                # Hold the headers until the first body chunk shows how the body is sent
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            initial_message, start_message = start_message, None
+            content_type = Headers(raw=initial_message["headers"]).get("content-type", "")
+            if message.get("more_body", False) or content_type.startswith("application/x-ndjson"):
+                passthrough = True
+                await send(initial_message)
+                await send(message)
+                return
+
+            # Complete single-chunk body: hand it to the stock gzip responder
+            async def replay(scope, receive, gzip_send):
+                await gzip_send(initial_message)
+                await gzip_send(message)
+
+            responder = GZipResponder(replay, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+
+        await self.app(scope, receive, send_selectively)
+
+
+# Response compression (list/config/log payloads are highly repetitive JSON)
+app.add_middleware(APIGZipMiddleware, minimum_size=1024)
+
 # API Request Logging Middleware
 from app.core.logging import log_api_request
 import time
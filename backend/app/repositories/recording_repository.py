@@ -3,8 +3,8 @@ Recording Repository - Data access layer for Recording entities
 """
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, delete, not_
+from sqlalchemy.orm import joinedload
 
 from app.database.models import Recording, RecordingSchedule
 
@@ -35,7 +35,7 @@ class RecordingRepository:
         """Get recording by ID"""
         result = await self.session.execute(
             select(Recording)
-            .options(selectinload(Recording.schedule))
+            .options(joinedload(Recording.schedule))
             .where(Recording.id == recording_id)
         )
         return result.scalar_one_or_none()
@@ -52,8 +52,8 @@ class RecordingRepository:
     async def create(self, recording: Recording) -> Recording:
         """Create new recording"""
         self.session.add(recording)
-        await self.session.flush()  # Flush to get ID without committing
-        await self.session.refresh(recording)
+        # Flush assigns the ID (via RETURNING); column defaults are client-side, so no refresh SELECT is needed
+        await self.session.flush()
         return recording
 
     async def update(self, recording: Recording) -> Recording:
@@ -61,10 +61,28 @@ class RecordingRepository:
         await self.session.merge(recording)
         return recording
 
+    async def get_file_path(self, recording_id: int) -> Optional[str]:
+        """Get only the file path of a recording (None if not found)"""
+        result = await self.session.execute(
+            select(Recording.file_path).where(Recording.id == recording_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def toggle_favorite(self, recording_id: int) -> Optional[bool]:
+        """Flip favorite flag in a single statement, returning the new value (None if not found)"""
+        result = await self.session.execute(
+            update(Recording)
+            .where(Recording.id == recording_id)
+            .values(is_favorite=not_(Recording.is_favorite))
+            .returning(Recording.is_favorite)
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, recording_id: int) -> bool:
         """Delete recording by ID"""
-        recording = await self.get_by_id(recording_id)
-        if recording:
-            await self.session.delete(recording)
-            return True
-        return False
\ No newline at end of file
+        result = await self.session.execute(
+            delete(Recording)
+            .where(Recording.id == recording_id)
+            .returning(Recording.id)
+        )
+        return result.scalar_one_or_none() is not None
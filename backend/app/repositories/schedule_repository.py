@@ -1,12 +1,35 @@
 """
 Schedule Repository - Data access layer for RecordingSchedule entities
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.orm import load_only, raiseload
 
-from app.database.models import RecordingSchedule
+from app.database.models import RecordingSchedule, Recording
+
+
+# Columns served by schedule list responses (keeps future large columns out of list queries)
+SCHEDULE_LIST_COLUMNS = (
+    RecordingSchedule.id,
+    RecordingSchedule.platform,
+    RecordingSchedule.streamer_id,
+    RecordingSchedule.streamer_name,
+    RecordingSchedule.quality,
+    RecordingSchedule.custom_arguments,
+    RecordingSchedule.enabled,
+    RecordingSchedule.output_format,
+    RecordingSchedule.filename_template,
+    RecordingSchedule.rotation_enabled,
+    RecordingSchedule.rotation_type,
+    RecordingSchedule.max_age_days,
+    RecordingSchedule.max_count,
+    RecordingSchedule.max_size_gb,
+    RecordingSchedule.protect_favorites,
+    RecordingSchedule.delete_empty_files,
+    RecordingSchedule.created_at,
+    RecordingSchedule.updated_at,
+)
 
 
 class ScheduleRepository:
@@ -24,6 +47,32 @@ class ScheduleRepository:
         )
         return result.scalar_one_or_none()
 
+    async def list_all(self) -> List[RecordingSchedule]:
+        """Get all schedules, loading only the columns served by list responses (relationships raise if touched)"""
+        result = await self.session.execute(
+            select(RecordingSchedule).options(load_only(*SCHEDULE_LIST_COLUMNS), raiseload("*"))
+        )
+        return result.scalars().all()
+
+    async def get_status_rows(self, schedule_ids: List[int]) -> List[Any]:
+        """Get status columns plus latest recording time for a set of schedules in one aggregate query"""
+        if not schedule_ids:
+            return []
+        result = await self.session.execute(
+            select(
+                RecordingSchedule.id,
+                RecordingSchedule.platform,
+                RecordingSchedule.streamer_id,
+                RecordingSchedule.streamer_name,
+                RecordingSchedule.enabled,
+                func.max(Recording.created_at).label("last_recording_at")
+            )
+            .outerjoin(Recording, Recording.schedule_id == RecordingSchedule.id)
+            .where(RecordingSchedule.id.in_(schedule_ids))
+            .group_by(RecordingSchedule.id)
+        )
+        return result.mappings().all()
+
     async def get_all_enabled(self) -> List[RecordingSchedule]:
         """Get all enabled schedules"""
         result = await self.session.execute(
@@ -40,22 +89,36 @@ class ScheduleRepository:
         )
         return result.scalars().all()
 
-    async def create(self, schedule: RecordingSchedule) -> RecordingSchedule:
-        """Create new schedule"""
-        self.session.add(schedule)
-        await self.session.flush()  # Flush to get ID without committing
-        await self.session.refresh(schedule)
-        return schedule
+    async def create(self, values: Dict[str, Any]) -> RecordingSchedule:
+        """Create new schedule with a single INSERT ... RETURNING (no flush/refresh round-trips)"""
+        result = await self.session.execute(
+            insert(RecordingSchedule)
+            .values(**values)
+            .returning(RecordingSchedule)
+        )
+        return result.scalar_one()
 
-    async def update(self, schedule: RecordingSchedule) -> RecordingSchedule:
-        """Update existing schedule"""
-        await self.session.merge(schedule)
-        return schedule
+    async def update_fields(self, schedule_id: int, values: Dict[str, Any]) -> Optional[RecordingSchedule]:
+        """
+        Update schedule columns with a single UPDATE ... RETURNING (None if not found)
+
+        Raises IntegrityError if the new platform/streamer_id pair is already scheduled.
+        """
+        if not values:
+            return await self.get_by_id(schedule_id)
+        result = await self.session.execute(
+            update(RecordingSchedule)
+            .where(RecordingSchedule.id == schedule_id)
+            .values(**values)
+            .returning(RecordingSchedule)
+        )
+        return result.scalar_one_or_none()
 
     async def delete(self, schedule_id: int) -> bool:
         """Delete schedule by ID"""
-        schedule = await self.get_by_id(schedule_id)
-        if schedule:
-            await self.session.delete(schedule)
-            return True
-        return False
\ No newline at end of file
+        result = await self.session.execute(
+            delete(RecordingSchedule)
+            .where(RecordingSchedule.id == schedule_id)
+            .returning(RecordingSchedule.id)
+        )
+        return result.scalar_one_or_none() is not None
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+System Config Repository - Data access layer for SystemConfig entities
+"""
+from typing import Any, Dict, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.database.models import SystemConfig, get_local_now
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE support
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+class SystemConfigRepository:
+    """Repository for SystemConfig data access operations"""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session"""
+        self.session = session
+
+    async def upsert(self, rows: List[Dict[str, Any]], update_columns: Sequence[str] = ("config_value",)):
+        """
+        Insert or update config rows keyed by config_key in a single statement
+
+        Existing rows only have update_columns overwritten; new rows are inserted as given.
+        """
+        if not rows:
+            return
+        insert = _UPSERT_INSERTS[self.session.bind.dialect.name]
+        stmt = insert(SystemConfig).values(rows)
+        set_ = {column: stmt.excluded[column] for column in update_columns}
+        # onupdate hooks don't fire for ON CONFLICT, so bump updated_at explicitly
+        set_["updated_at"] = get_local_now()
+        await self.session.execute(
+            stmt.on_conflict_do_update(index_elements=[SystemConfig.config_key], set_=set_)
+        )
@@ -38,6 +38,11 @@ class AsyncSQLAlchemyUnitOfWork:
         self.session_factory = session_factory
         self._session: AsyncSession = None
 
+    @property
+    def session(self) -> AsyncSession:
+        """Session shared by this unit of work's repositories"""
+        return self._session
+
     async def __aenter__(self):
         """Start new transaction"""
         self._session = self.session_factory()
@@ -24,6 +24,9 @@ class PlatformDefinitionResponse(BaseModel):
     supported_output_formats: List[str]
     default_filename_template: str
 
+    class Config:
+        from_attributes = True
+
 
 class PlatformDefinitionListResponse(BaseModel):
     """Schema for list of available platform definitions"""
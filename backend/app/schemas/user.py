@@ -0,0 +1,19 @@
+"""
+User Pydantic schemas
+"""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class UserResponse(BaseModel):
+    """Schema for user response (read straight from ORM rows)"""
+    id: int
+    username: str
+    is_admin: bool
+    is_active: bool
+    created_at: datetime
+    last_login: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -2,9 +2,11 @@
 Registry-based platform service for managing platform strategies and configurations
 """
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update
+from sqlalchemy.engine import RowMapping
 
 from app.database.models import PlatformUserConfig
 from app.services.platforms.strategy_factory import PlatformStrategyFactory
@@ -14,9 +16,21 @@ from app.services.platforms.base_strategy import PlatformStrategy, StreamInfo, S
 logger = logging.getLogger(__name__)
 
 
+class PlatformNotSupportedError(Exception):
+    """Raised when a platform is not supported or has no usable strategy"""
+    
+    def __init__(self, platform: str):
+        super().__init__(f"Platform '{platform}' not supported or not configured")
+        self.platform = platform
+
+
 class PlatformService:
     """Registry-based service for managing platform strategies and configurations"""
     
+    # Process-wide platform readiness cache: platform -> (expires_at, is_ready)
+    _STRATEGY_TTL = 30.0
+    _strategy_valid_cache: Dict[str, Tuple[float, bool]] = {}
+    
     def __init__(self, db: AsyncSession):
         self.db = db
         self._strategies_cache: Dict[str, PlatformStrategy] = {}
@@ -25,9 +39,11 @@ class PlatformService:
         """Invalidate strategy cache for a platform or all platforms"""
         if platform:
             self._strategies_cache.pop(platform, None)
+            self._strategy_valid_cache.pop(platform, None)
             logger.info(f"Invalidated cache for platform: {platform}")
         else:
             self._strategies_cache.clear()
+            self._strategy_valid_cache.clear()
             logger.info("Invalidated all platform strategy cache")
     
     async def get_platform_user_config(self, platform: str) -> Optional[PlatformUserConfig]:
@@ -59,14 +75,20 @@ class PlatformService:
         if platform in self._strategies_cache:
             return self._strategies_cache[platform]
         
-        # Get user config from database
-        user_config_db = await self.get_platform_user_config(platform)
+        # Get user config from database (only the columns the strategy needs)
+        result = await self.db.execute(
+            select(
+                PlatformUserConfig.user_credentials,
+                PlatformUserConfig.custom_settings
+            ).where(PlatformUserConfig.platform_name == platform)
+        )
+        user_config_row = result.first()
         user_config = {}
         
-        if user_config_db:
+        if user_config_row:
             # Combine user credentials and custom settings
-            user_config.update(user_config_db.user_credentials)
-            user_config.update(user_config_db.custom_settings)
+            user_config.update(user_config_row.user_credentials)
+            user_config.update(user_config_row.custom_settings)
         
         # Create strategy using registry
         strategy = PlatformStrategyFactory.create_strategy(platform, user_config)
@@ -129,6 +151,66 @@ class PlatformService:
         
         return strategy.get_streamlink_args(streamer_id, quality)
     
+    def _cached_readiness(self, platform: str) -> Optional[bool]:
+        """Return cached readiness for a platform, or None if unknown/expired"""
+        cached = self._strategy_valid_cache.get(platform)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        return cached[1]
+    
+    def _remember_readiness(self, platform: str, is_ready: bool):
+        """Cache readiness for a platform for the configured TTL"""
+        self._strategy_valid_cache[platform] = (time.monotonic() + self._STRATEGY_TTL, is_ready)
+    
+    async def _require_strategy(self, platform: str) -> PlatformStrategy:
+        """Resolve strategy for a platform, raising PlatformNotSupportedError if unavailable"""
+        # Known-unavailable platforms are rejected without touching the database
+        if self._cached_readiness(platform) is False:
+            raise PlatformNotSupportedError(platform)
+        
+        strategy = await self.get_strategy(platform)
+        self._remember_readiness(platform, strategy is not None)
+        if not strategy:
+            raise PlatformNotSupportedError(platform)
+        return strategy
+    
+    async def get_stream_info_checked(self, platform: str, streamer_id: str) -> Tuple[PlatformStrategy, Optional[StreamInfo]]:
+        """
+        Validate platform and get stream information in a single call
+        
+        Args:
+            platform: Platform name
+            streamer_id: Streamer identifier
+            
+        Returns:
+            Tuple of (strategy, StreamInfo or None if not live/error)
+            
+        Raises:
+            PlatformNotSupportedError: If platform is not supported or not configured
+        """
+        strategy = await self._require_strategy(platform)
+        return strategy, await strategy.get_stream_info(streamer_id)
+    
+    async def get_stream_urls_checked(self, platform: str, streamer_id: str) -> Tuple[PlatformStrategy, List[StreamUrl]]:
+        """
+        Validate platform and get available stream URLs in a single call
+        
+        Raises:
+            PlatformNotSupportedError: If platform is not supported or not configured
+        """
+        strategy = await self._require_strategy(platform)
+        return strategy, await strategy.get_stream_urls(streamer_id)
+    
+    async def get_streamlink_args_checked(self, platform: str, streamer_id: str, quality: str = "best") -> Tuple[PlatformStrategy, List[str]]:
+        """
+        Validate platform and get Streamlink command arguments in a single call
+        
+        Raises:
+            PlatformNotSupportedError: If platform is not supported or not configured
+        """
+        strategy = await self._require_strategy(platform)
+        return strategy, strategy.get_streamlink_args(streamer_id, quality)
+    
     # --- Registry-based Platform Management ---
     
     def get_available_platforms(self) -> List[PlatformDefinition]:
@@ -150,15 +232,8 @@ class PlatformService:
     
     # --- User Configuration Management ---
     
-    async def update_platform_config(self, platform: str, user_credentials: Dict = None, custom_settings: Dict = None):
-        """
-        Update or create platform user configuration
-        
-        Args:
-            platform: Platform name
-            user_credentials: User credentials (API keys, tokens, etc.)
-            custom_settings: Custom streamlink arguments and settings
-        """
+    def _validate_config_update(self, platform: str, user_credentials: Optional[Dict], custom_settings: Optional[Dict]):
+        """Validate platform support and configuration values, raising ValueError if invalid"""
         # Validate platform exists in registry
         if not PlatformRegistry.is_platform_supported(platform):
             raise ValueError(f"Platform {platform} is not supported")
@@ -172,6 +247,17 @@ class PlatformService:
         
         if combined_config and not self.validate_platform_config(platform, combined_config):
             raise ValueError(f"Invalid configuration for platform {platform}")
+    
+    async def update_platform_config(self, platform: str, user_credentials: Dict = None, custom_settings: Dict = None):
+        """
+        Update or create platform user configuration
+        
+        Args:
+            platform: Platform name
+            user_credentials: User credentials (API keys, tokens, etc.)
+            custom_settings: Custom streamlink arguments and settings
+        """
+        self._validate_config_update(platform, user_credentials, custom_settings)
         
         # Get existing config or create new one
         existing = await self.get_platform_user_config(platform)
@@ -197,26 +283,91 @@ class PlatformService:
         self.invalidate_cache(platform)
         logger.info(f"Updated configuration for platform: {platform}")
     
-    async def delete_platform_config(self, platform: str):
-        """Delete platform user configuration"""
-        await self.db.execute(
-            delete(PlatformUserConfig).where(PlatformUserConfig.platform_name == platform)
+    async def update_existing_platform_config(
+        self,
+        platform: str,
+        user_credentials: Dict = None,
+        custom_settings: Dict = None
+    ) -> Optional[PlatformUserConfig]:
+        """
+        Update an existing platform user configuration in a single UPDATE ... RETURNING
+        
+        Args:
+            platform: Platform name
+            user_credentials: User credentials (API keys, tokens, etc.)
+            custom_settings: Custom streamlink arguments and settings
+            
+        Returns:
+            Updated PlatformUserConfig or None if no configuration exists
+        """
+        self._validate_config_update(platform, user_credentials, custom_settings)
+        
+        values = {}
+        if user_credentials is not None:
+            values["user_credentials"] = user_credentials
+        if custom_settings is not None:
+            values["custom_settings"] = custom_settings
+        
+        # Nothing to change, only report whether the configuration exists
+        if not values:
+            return await self.get_platform_user_config(platform)
+        
+        result = await self.db.execute(
+            update(PlatformUserConfig)
+            .where(PlatformUserConfig.platform_name == platform)
+            .values(**values)
+            .returning(PlatformUserConfig)
+        )
+        config = result.scalar_one_or_none()
+        if config is None:
+            return None
+        
+        await self.db.commit()
+        
+        # Invalidate cache for this platform
+        self.invalidate_cache(platform)
+        logger.info(f"Updated configuration for platform: {platform}")
+        return config
+    
+    async def delete_platform_config(self, platform: str) -> bool:
+        """
+        Delete platform user configuration
+        
+        Returns:
+            True if a configuration was deleted, False if none existed
+        """
+        result = await self.db.execute(
+            delete(PlatformUserConfig)
+            .where(PlatformUserConfig.platform_name == platform)
+            .returning(PlatformUserConfig.platform_name)
         )
+        if result.scalar_one_or_none() is None:
+            return False
+        
         await self.db.commit()
         
         # Invalidate cache for this platform
         self.invalidate_cache(platform)
         logger.info(f"Deleted configuration for platform: {platform}")
+        return True
     
     async def get_configured_platforms(self) -> List[str]:
         """Get list of platforms that have user configurations"""
         result = await self.db.execute(select(PlatformUserConfig.platform_name))
         return [row[0] for row in result.fetchall()]
     
-    async def get_all_platform_configs(self) -> List[PlatformUserConfig]:
-        """Get all platform user configurations"""
-        result = await self.db.execute(select(PlatformUserConfig))
-        return result.scalars().all()
+    async def get_all_platform_configs(self) -> List[RowMapping]:
+        """Get all platform user configurations as plain column mappings (no ORM hydration)"""
+        result = await self.db.execute(
+            select(
+                PlatformUserConfig.platform_name,
+                PlatformUserConfig.user_credentials,
+                PlatformUserConfig.custom_settings,
+                PlatformUserConfig.created_at,
+                PlatformUserConfig.updated_at
+            )
+        )
+        return result.mappings().all()
     
     async def close(self):
         """Close all strategy sessions"""
@@ -99,6 +99,7 @@ class PlatformRegistry:
     Registry for managing platform definitions with decorator-based registration
     """
     _platforms: Dict[str, PlatformDefinition] = {}
+    _version: int = 0  # Bumped on every registry change so derived views can be cached
     
     @classmethod
     def register(cls, definition: PlatformDefinition):
@@ -113,18 +114,25 @@ class PlatformRegistry:
         """
         def wrapper(definition_instance):
             cls._platforms[definition.name] = definition
+            cls._version += 1
             logger.info(f"Registered platform: {definition.name} ({definition.display_name})")
             return definition_instance
         
         # If used as @PlatformRegistry.register without parentheses
         if isinstance(definition, PlatformDefinition):
             cls._platforms[definition.name] = definition
+            cls._version += 1
             logger.info(f"Registered platform: {definition.name} ({definition.display_name})")
             return definition
         
         # If used as @PlatformRegistry.register()
         return wrapper
     
+    @classmethod
+    def get_version(cls) -> int:
+        """Get registry version (changes whenever platforms are registered or cleared)"""
+        return cls._version
+    
     @classmethod
     def get_all_platforms(cls) -> List[PlatformDefinition]:
         """Get list of all registered platform definitions"""
@@ -190,6 +198,7 @@ class PlatformRegistry:
     def clear_registry(cls):
         """Clear all registered platforms (for testing)"""
         cls._platforms.clear()
+        cls._version += 1
     
     @classmethod
     def get_platform_by_strategy_class(cls, strategy_class: Type[PlatformStrategy]) -> Optional[PlatformDefinition]:
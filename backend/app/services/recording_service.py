@@ -537,7 +537,7 @@ class RecordingService:
             # Then, get recordings from database with status='recording' (in case of server restart)
             # We need a separate query since we're already in UoW context
             from sqlalchemy import select
-            result = await self.uow._session.execute(
+            result = await self.uow.session.execute(
                 select(Recording).where(Recording.status == "recording")
             )
             db_active_recordings = result.scalars().all()
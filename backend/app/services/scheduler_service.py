@@ -358,7 +358,7 @@ class SchedulerService:
             from app.services.output_filename_template import OutputFileNameTemplate
 
             # Get platform definition to get default filename template
-            platform_service = PlatformService(uow._session)
+            platform_service = PlatformService(uow.session)
             platform_definition = platform_service.get_platform_definition(schedule.platform)
 
             # Use schedule's filename template or platform default
@@ -398,7 +398,7 @@ class SchedulerService:
             logger.info(f"Started recording {created_recording.id} for schedule {schedule.id}")
 
             # Create streamlink service with Unit of Work session
-            streamlink_service = StreamlinkService(uow._session, self._session_factory)
+            streamlink_service = StreamlinkService(uow.session, self._session_factory)
 
             # Start recording
             success = await streamlink_service.start_recording(
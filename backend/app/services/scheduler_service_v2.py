@@ -7,6 +7,8 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from sqlalchemy.exc import IntegrityError
+
 from app.database.models import RecordingSchedule, Recording
 from app.repositories.unit_of_work import AsyncSQLAlchemyUnitOfWork
 from app.services.platform_service import PlatformService
@@ -15,6 +17,9 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fields that identify the monitored stream; other edits are picked up by the loop's per-cycle reload
+MONITOR_IDENTITY_FIELDS = frozenset({"platform", "streamer_id"})
+
 
 class SchedulerServiceV2:
     """Service for managing automated recording schedules using Repository pattern"""
@@ -97,6 +102,24 @@ class SchedulerServiceV2:
         except Exception as e:
             logger.error(f"Error starting monitoring for schedule {schedule.id}: {e}")
 
+    def is_monitoring(self, schedule_id: int) -> bool:
+        """Check if a monitoring loop is alive for a schedule"""
+        task = self._monitoring_tasks.get(schedule_id)
+        return task is not None and not task.done()
+
+    async def refresh_monitoring(self, schedule: RecordingSchedule, changed_fields) -> None:
+        """
+        Restart monitoring only when the running loop cannot pick up the change itself
+
+        The loop reloads the schedule every cycle, so edits like quality or rotation settings
+        need no restart; a disabled schedule's loop exits on its next cycle.
+        """
+        if not schedule.enabled:
+            return
+        if self.is_monitoring(schedule.id) and not (MONITOR_IDENTITY_FIELDS & set(changed_fields)):
+            return
+        await self._start_monitoring(schedule)
+
     async def run_rotation_cleanup(self):
         """Run periodic rotation cleanup"""
         try:
@@ -211,7 +234,7 @@ class SchedulerServiceV2:
                 async with AsyncSQLAlchemyUnitOfWork(self.session_factory) as uow:
                     # Query only recordings with 'recording' status using repository
                     from sqlalchemy import select
-                    result = await uow._session.execute(
+                    result = await uow.session.execute(
                         select(Recording).where(Recording.status == "recording")
                     )
                     active_recordings = result.scalars().all()
@@ -275,7 +298,7 @@ class SchedulerServiceV2:
                         if not await recording_service.is_schedule_recording_active(current_schedule.id):
                             # Not recording, now check if stream is live (slower API call)
                             # Create platform service with same session
-                            platform_service = PlatformService(uow._session)
+                            platform_service = PlatformService(uow.session)
                             stream_info = await platform_service.get_stream_info(
                                 current_schedule.platform,
                                 current_schedule.streamer_id
@@ -311,7 +334,7 @@ class SchedulerServiceV2:
             from app.services.output_filename_template import OutputFileNameTemplate
 
             # Get platform definition to get default filename template
-            platform_service = PlatformService(uow._session)
+            platform_service = PlatformService(uow.session)
             platform_definition = platform_service.get_platform_definition(schedule.platform)
 
             # Use schedule's filename template or platform default
@@ -345,7 +368,6 @@ class SchedulerServiceV2:
             )
 
             recording = await uow.recordings.create(recording)
-            await uow.flush()  # Flush to get ID without committing
 
             logger.info(f"Started recording {recording.id} for schedule {schedule.id}")
 
@@ -366,12 +388,16 @@ class SchedulerServiceV2:
         except Exception as e:
             logger.error(f"Error starting recording for schedule {schedule.id}: {e}")
 
-    async def add_schedule(self, schedule: RecordingSchedule) -> bool:
-        """Add a new schedule"""
+    async def add_schedule(self, values: Dict) -> Optional[RecordingSchedule]:
+        """
+        Add a new schedule from validated column values
+
+        Raises IntegrityError if a schedule for the same platform/streamer exists.
+        """
         try:
             async with AsyncSQLAlchemyUnitOfWork(self.session_factory) as uow:
                 # Save to database using repository
-                schedule = await uow.schedules.create(schedule)
+                schedule = await uow.schedules.create(values)
                 await uow.commit()
 
                 # Start monitoring if enabled
@@ -379,29 +405,41 @@ class SchedulerServiceV2:
                     await self._start_monitoring(schedule)
 
                 logger.info(f"Added schedule {schedule.id}")
-                return True
+                return schedule
 
+        except IntegrityError:
+            # Duplicate schedule is a client error; let the endpoint report it
+            raise
         except Exception as e:
             logger.error(f"Error adding schedule: {e}")
-            return False
+            return None
 
-    async def update_schedule(self, schedule: RecordingSchedule) -> bool:
-        """Update an existing schedule"""
+    async def update_schedule(self, schedule_id: int, values: Dict) -> Optional[RecordingSchedule]:
+        """
+        Update schedule columns and restart monitoring (None if not found or on error)
+
+        Raises IntegrityError if the new platform/streamer_id pair is already scheduled.
+        """
         try:
             async with AsyncSQLAlchemyUnitOfWork(self.session_factory) as uow:
-                # Update in database using repository
-                await uow.schedules.update(schedule)
+                # Single UPDATE ... RETURNING instead of merge's SELECT + UPDATE
+                schedule = await uow.schedules.update_fields(schedule_id, values)
+                if not schedule:
+                    return None
                 await uow.commit()
 
-                # Restart monitoring
-                await self._start_monitoring(schedule)
+                # Restart monitoring if the change requires it
+                await self.refresh_monitoring(schedule, values)
 
                 logger.info(f"Updated schedule {schedule.id}")
-                return True
+                return schedule
 
+        except IntegrityError:
+            # Duplicate schedule is a client error; let the endpoint report it
+            raise
         except Exception as e:
             logger.error(f"Error updating schedule: {e}")
-            return False
+            return None
 
     async def stop_monitoring(self, schedule_id: int) -> bool:
         """Stop monitoring a schedule without deleting from database"""
@@ -514,10 +552,27 @@ class SchedulerServiceV2:
         try:
             status_list = []
 
-            for schedule_id in self._monitoring_tasks.keys():
-                status = await self.get_schedule_status(schedule_id)
-                if status:
-                    status_list.append(status)
+            # Snapshot tasks so the map can change while we await the query
+            tasks = dict(self._monitoring_tasks)
+
+            # One aggregate round-trip covers every monitored schedule
+            async with AsyncSQLAlchemyUnitOfWork(self.session_factory) as uow:
+                rows = await uow.schedules.get_status_rows(list(tasks))
+
+            last_check = datetime.now().isoformat()
+
+            for row in rows:
+                last_recording_at = row["last_recording_at"]
+                status_list.append({
+                    "schedule_id": row["id"],
+                    "platform": row["platform"],
+                    "streamer_id": row["streamer_id"],
+                    "streamer_name": row["streamer_name"],
+                    "enabled": row["enabled"],
+                    "monitoring_active": not tasks[row["id"]].done(),
+                    "last_check": last_check,
+                    "last_recording_at": last_recording_at.isoformat() if last_recording_at else None
+                })
 
             return status_list
 
@@ -536,7 +591,7 @@ class SchedulerServiceV2:
                     return False
 
                 # Create platform service
-                platform_service = PlatformService(uow._session)
+                platform_service = PlatformService(uow.session)
 
                 # Check stream status immediately
                 stream_info = await platform_service.get_stream_info(
@@ -0,0 +1,37 @@
+"""
+Tests for log level extraction from free-form log lines
+"""
+import pytest
+
+from app.api.v1.endpoints.logs import _extract_level
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("line, expected", [
+    ("2024-01-01 12:00:00 - app.main - ERROR - boom", "ERROR"),
+    ("ERROR:root:boom", "ERROR"),
+    ("level=ERROR msg", "ERROR"),
+    ("[cli][ERROR] x", "ERROR"),
+    ("<ERROR> x", "ERROR"),
+    ('"ERROR" x', "ERROR"),
+    ("x ERROR.", "ERROR"),
+    ("WARNING: disk almost full", "WARNING"),
+    ("[DEBUG] then ERROR later", "DEBUG"),
+    ("CRITICAL(db) lost connection", "CRITICAL"),
+])
+def test_extract_level_finds_level_word(line, expected):
+    """Level words are found regardless of the punctuation around them"""
+    assert _extract_level(line) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("line", [
+    "plain message without a level",
+    "ERRORS happened",
+    "MYERROR_CODE 42",
+    "error in lowercase",
+    "",
+])
+def test_extract_level_defaults_to_info(line):
+    """Lines without a standalone uppercase level word default to INFO"""
+    assert _extract_level(line) == "INFO"